@@ -0,0 +1,95 @@
+import json
+import time
+
+from event_models.action.action import ActionLogSchema, ActionSchema
+from event_models.action.batch import (
+    action_list_adapter,
+    action_log_list_adapter,
+    dump_action_logs_json,
+    dump_actions_json,
+    validate_action_logs_json,
+    validate_actions_json,
+)
+
+ROWS = 20_000
+
+ACTION = {
+    "action_id": 1,
+    "created": "2024-06-01T12:00:00",
+    "origin_id": 2,
+    "action": "ACTIVE",
+    "action_exchange_id": "exchange-1",
+    "external_mapping": {"Viagogo": 1, "StubHub": 2},
+    "data": {
+        "source_id": "source",
+        "local_datetime": "2024-07-01T20:00:00",
+        "listing_id": 1,
+        "inventory_id": 2,
+        "section": "101",
+        "row": "A",
+        "seats": ["1", "2"],
+        "internal_notes": "",
+        "public_notes": "",
+        "quantity": 2,
+        "tags": ["tag"],
+        "listing_price": "105.50",
+        "original_price": "90.00",
+        "split_type": "ANY",
+        "price_markup": {"Viagogo": "1.50", "StubHub": "2.00"},
+    },
+}
+
+ACTION_LOGS = [
+    {
+        "action_id": 1,
+        "action_exchange_id": "exchange-1",
+        "action_exchange": "Viagogo",
+        "sync_time": "2024-06-01T12:00:00",
+        "synced": True,
+    },
+    {
+        "action_id": 2,
+        "action_exchange_id": "exchange-2",
+        "action_exchange": "StubHub",
+        "synced": False,
+        "error": {"2024-06-01T12:00:00": "timeout"},
+        "error_code": "API_ERROR",
+    },
+]
+
+
+def measure(label: str, func: object) -> None:
+    started = time.perf_counter()
+    func()  # type: ignore[operator]
+    print(f"{label:<32}{time.perf_counter() - started:.3f}s")
+
+
+def main() -> None:
+    action_rows = [ACTION] * ROWS
+    log_rows = ACTION_LOGS * (ROWS // 2)
+    actions_json = json.dumps(action_rows).encode()
+    logs_json = json.dumps(log_rows).encode()
+    action_row_json = [json.dumps(row).encode() for row in action_rows]
+    log_row_json = [json.dumps(row).encode() for row in log_rows]
+
+    # build the cached adapters outside of the measurements
+    action_list_adapter()
+    action_log_list_adapter()
+
+    measure("actions per row json", lambda: [ActionSchema.model_validate_json(row) for row in action_row_json])
+    measure("actions batch json", lambda: validate_actions_json(actions_json))
+
+    actions = validate_actions_json(actions_json)
+    measure("actions dump per row", lambda: [action.model_dump_json() for action in actions])
+    measure("actions dump batch", lambda: dump_actions_json(actions))
+
+    measure("action logs per row json", lambda: [ActionLogSchema.model_validate_json(row) for row in log_row_json])
+    measure("action logs batch json", lambda: validate_action_logs_json(logs_json))
+
+    action_logs = validate_action_logs_json(logs_json)
+    measure("action logs dump per row", lambda: [action_log.model_dump_json() for action_log in action_logs])
+    measure("action logs dump batch", lambda: dump_action_logs_json(action_logs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import datetime
+import time
+from decimal import Decimal
+
+from event_models.notification.notification import DropsData, DropsMessage, FrozenDropsMessage, SeatData
+
+SEATS = 2_000
+SUBSCRIBERS = 50
+
+
+def build_message() -> DropsMessage:
+    seats = [
+        SeatData(section=f"Section {seat % 40}", row=f"Row {seat % 30}", seat=str(seat), price=Decimal("120.50"))
+        for seat in range(SEATS)
+    ]
+
+    return DropsMessage(event_id="event", timestamp=datetime.datetime(2024, 6, 1, 12), data=DropsData(seats=seats))
+
+
+def main() -> None:
+    message = build_message()
+    frozen = FrozenDropsMessage.from_message(message)
+
+    assert frozen.json_bytes() == message.model_dump_json().encode()  # noqa: S101
+
+    # a fresh frozen message for the timing, the first publish serializes it
+    frozen = FrozenDropsMessage.from_message(message)
+
+    started = time.perf_counter()
+    for _ in range(SUBSCRIBERS):
+        message.model_dump_json().encode()
+    dumped = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(SUBSCRIBERS):
+        frozen.json_view()
+    cached = time.perf_counter() - started
+
+    print(f"{SEATS} seats to {SUBSCRIBERS} subscribers")
+    print(f"{'model_dump_json per publish':<32}{dumped * 1000:8.1f} ms")
+    print(f"{'cached json_view':<32}{cached * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import subprocess
+import sys
+
+MODULES = [
+    "event_models.action.action",
+    "event_models.available.ticketmaster",
+    "event_models.event.event",
+    "event_models.logger.logger",
+    "event_models.notification.notification",
+    "event_models.trigger.model.result",
+]
+RUNS = 5
+
+
+def import_time_us(module: str) -> int:
+    """Cumulative import time of the module in a fresh interpreter, as reported by -X importtime."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    for line in reversed(result.stderr.splitlines()):
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+
+        if name.strip() == module:
+            return int(cumulative)
+
+    raise ValueError(f"{module} not found in the import time report")
+
+
+def main() -> None:
+    for module in MODULES:
+        best = min(import_time_us(module) for _ in range(RUNS))
+        print(f"{module:<44}{best / 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
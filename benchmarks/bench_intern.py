@@ -0,0 +1,97 @@
+import gc
+import json
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from event_models.available.ticketmaster import TicketmasterEventAvailable
+from event_models.intern.intern import EventInternPools, InternPool, interning
+
+EVENTS = 10
+PLACES = 5_000
+
+
+def build_redis_hashes() -> list[tuple[str, bytes]]:
+    """New schema availability hashes, JSON encoded so that every decode creates fresh strings."""
+    rng = random.Random(42)  # noqa: S311
+    hashes = []
+
+    for event in range(EVENTS):
+        sections = [f"Section {section}" for section in range(100, 140)]
+        rows = [f"Row {row}" for row in range(1, 30)]
+        places = {}
+
+        for place in range(PLACES):
+            section = rng.choice(sections)
+            places[f"{event}-{place}"] = [
+                f"{rng.uniform(20, 400):.2f}",
+                f"{rng.uniform(25, 450):.2f}",
+                "offer-standard",
+                rng.choice(["Standard Admission", "Official Platinum", "Verified Resale"]),
+                [1, 2, 3, 4],
+                False,
+                rng.choice(["primary", "resale"]),
+                None,
+                f"Lower Level {section}",
+                section,
+                rng.choice(rows),
+                rng.randint(1, 30),
+                rng.randint(1, 40),
+                str(rng.randint(1, 40)),
+                rng.sample(["aisle", "obstructed", "accessible", "standard"], 2),
+                ["Standard Ticket", "Mobile Entry"],
+                "2024-06-01T12:00:00",
+                None,
+                None,
+            ]
+
+        hashes.append((f"event-{event}", json.dumps(places).encode()))
+
+    return hashes
+
+
+def decode(hashes: list[tuple[str, bytes]]) -> list[TicketmasterEventAvailable]:
+    return [TicketmasterEventAvailable.from_place_dict(event_id, json.loads(data)) for event_id, data in hashes]
+
+
+def measure(label: str, func: Callable[[], Any]) -> None:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    print(f"{label:<24}{retained / 2**20:8.1f} MiB retained{elapsed:8.2f}s")
+
+
+def decode_global(hashes: list[tuple[str, bytes]]) -> list[TicketmasterEventAvailable]:
+    with interning(InternPool()):
+        return decode(hashes)
+
+
+def decode_per_event(hashes: list[tuple[str, bytes]]) -> list[TicketmasterEventAvailable]:
+    pools = EventInternPools()
+    events = []
+
+    for event_id, data in hashes:
+        with interning(pools.pool(event_id)):
+            events.append(TicketmasterEventAvailable.from_place_dict(event_id, json.loads(data)))
+
+    return events
+
+
+def main() -> None:
+    hashes = build_redis_hashes()
+
+    measure("without interning", lambda: decode(hashes))
+    measure("global pool", lambda: decode_global(hashes))
+    measure("per event pools", lambda: decode_per_event(hashes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import datetime
+import random
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from decimal import Decimal
+
+from event_models.action.action import ActionData, SplitType
+from event_models.action.pricing import HAS_NUMPY, PricingRule, compute_price, compute_prices
+from event_models.exchange.exchange import EventExchange
+
+LISTINGS = 20_000
+RUNS = 5
+EXCHANGES = [EventExchange.VIAGOGO, EventExchange.TICKETMASTER, EventExchange.STUBHUB, EventExchange.SEATGEEK]
+
+
+def build_listings(count: int) -> list[ActionData]:
+    rng = random.Random(42)  # noqa: S311
+    now = datetime.datetime.now()
+
+    return [
+        ActionData(
+            source_id="bench",
+            local_datetime=now,
+            listing_id=listing_id,
+            inventory_id=listing_id,
+            section="101",
+            row="A",
+            seats=["1", "2"],
+            internal_notes="",
+            public_notes="",
+            quantity=2,
+            tags=[],
+            listing_price=Decimal(rng.randint(1_000, 500_000)).scaleb(-2),
+            original_price=Decimal(rng.randint(1_000, 500_000)).scaleb(-2),
+            split_type=SplitType.ANY,
+            price_markup=defaultdict(
+                Decimal,
+                {exchange: Decimal(rng.randint(-500, 2_500)).scaleb(-2) for exchange in EXCHANGES},
+            ),
+        )
+        for listing_id in range(count)
+    ]
+
+
+def best_time(func: Callable[[], object]) -> float:
+    timings = []
+
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+
+    return min(timings)
+
+
+def main() -> None:
+    listings = build_listings(LISTINGS)
+    rule = PricingRule()
+
+    def decimal_loop() -> None:
+        for data in listings:
+            for exchange in EXCHANGES:
+                compute_price(data, exchange, rule)
+
+    print(f"decimal loop:  {best_time(decimal_loop):.3f}s")
+    print(f"python:        {best_time(lambda: compute_prices(listings, EXCHANGES, rule, use_numpy=False)):.3f}s")
+
+    if HAS_NUMPY:
+        print(f"numpy:         {best_time(lambda: compute_prices(listings, EXCHANGES, rule, use_numpy=True)):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
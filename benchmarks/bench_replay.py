@@ -0,0 +1,44 @@
+import asyncio
+import tempfile
+from pathlib import Path
+
+from event_models.traffic.replay import CallbackSink, ReplayReport, decode_record, replay
+from event_models.traffic.traffic import TrafficConfig, TrafficGenerator, TrafficKind, read_traffic, write_traffic
+
+RECORDS = 20_000
+TARGET_RATE = 5_000.0
+
+CONFIG = TrafficConfig(
+    seed=1,
+    # availability hashes are much larger than the other messages, keep them rare and small enough for a quick run
+    kinds={
+        TrafficKind.JOB_RUN: 0.3,
+        TrafficKind.JOB_SCRAP: 0.3,
+        TrafficKind.EVENT_MESSAGE: 0.35,
+        TrafficKind.AVAILABILITY: 0.005,
+        TrafficKind.NOTIFICATION: 0.05,
+    },
+    places_median=500,
+)
+
+
+def report(label: str, result: ReplayReport) -> None:
+    print(
+        f"{label:<24}{result.throughput:10.0f} records/s"
+        f"  p50 {(result.latency_p50 or 0) * 1000:8.2f} ms  p99 {(result.latency_p99 or 0) * 1000:8.2f} ms"
+    )
+
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "traffic.bin"
+        write_traffic(TrafficGenerator(CONFIG).records(RECORDS), path)
+        print(f"{RECORDS} records, {path.stat().st_size / 2**20:.1f} MiB")
+
+        sink = CallbackSink(decode_record)
+        report("decode, unpaced", await replay(read_traffic(path), sink))
+        report(f"decode, {TARGET_RATE:.0f}/s target", await replay(read_traffic(path), sink, rate=TARGET_RATE))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,44 @@
+import json
+import tempfile
+import time
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.bench_intern import EVENTS, PLACES, build_redis_hashes
+from event_models.available.snapshot import checkpoint, restore
+from event_models.available.ticketmaster import TicketmasterEventAvailable
+
+
+def timed(label: str, func: Callable[[], Any]) -> Any:
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+
+    print(f"{label:<28}{elapsed * 1000:10.1f} ms")
+    return result
+
+
+def main() -> None:
+    hashes = build_redis_hashes()
+    print(f"{EVENTS} events x {PLACES} places")
+
+    events = timed(
+        "decode redis hashes",
+        lambda: [TicketmasterEventAvailable.from_place_dict(event_id, json.loads(data)) for event_id, data in hashes],
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        timed("checkpoint", lambda: checkpoint(events, directory))
+        snapshots = timed("restore (mmap)", lambda: restore(directory))
+
+        timed("sum list prices (zero-copy)", lambda: sum(sum(s.list_price_cents) for s in snapshots.values()))
+        restored = timed("restore to models", lambda: [s.to_model() for s in snapshots.values()])
+
+        assert restored == events  # noqa: S101
+
+        for snapshot in snapshots.values():
+            snapshot.close()
+
+
+if __name__ == "__main__":
+    main()
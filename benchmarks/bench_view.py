@@ -0,0 +1,50 @@
+import gc
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.bench_intern import build_redis_hashes
+from event_models.available.ticketmaster import TicketmasterEventAvailable
+from event_models.view.view import to_views
+
+ACCESS_ROUNDS = 10
+
+
+def measure_memory(label: str, func: Callable[[], Any]) -> Any:
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:<24}{retained / 2**20:8.1f} MiB")
+    return result
+
+
+def measure_access(label: str, places: list[Any]) -> None:
+    started = time.perf_counter()
+
+    for _ in range(ACCESS_ROUNDS):
+        for place in places:
+            place.list_price, place.section, place.row, place.row_rank, place.seat_rank
+
+    elapsed = time.perf_counter() - started
+    print(f"{label:<24}{elapsed / (ACCESS_ROUNDS * len(places) * 5) * 1e9:8.1f} ns per attribute")
+
+
+def main() -> None:
+    event_id, data = build_redis_hashes()[0]
+    models = list(TicketmasterEventAvailable.from_place_dict(event_id, json.loads(data)).places.values())
+
+    # retained size of the objects themselves, the field values are shared by both
+    measure_memory("models", lambda: [model.model_copy() for model in models])
+    views = measure_memory("views", lambda: to_views(models))
+
+    measure_access("model attribute access", models)
+    measure_access("view attribute access", views)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+from typing import TYPE_CHECKING, Self
+
+from pydantic import BaseModel, ConfigDict
+
+
+class CachedJsonModel(BaseModel):
+    """Frozen model that serializes to JSON once and reuses the bytes.
+
+    The cache lives in a slot, outside of the pydantic state: it is not compared, copied or pickled, so every copy
+    - including ``model_copy(update=...)`` - serializes its own values. Subclasses declare frozen types for their nested
+    data, e.g. tuples of frozen models, so that the cached bytes cannot go stale.
+    """
+
+    __slots__ = ("_json_cache",)
+
+    if TYPE_CHECKING:
+        _json_cache: bytes
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
+    @classmethod
+    def from_message(cls, message: BaseModel) -> Self:
+        """Create the frozen variant of a message, its values are validated again into the frozen nested types."""
+        # unset fields stay unset, also in the nested models
+        return cls.model_validate(message.model_dump(by_alias=True, exclude_unset=True))
+
+    def json_bytes(self) -> bytes:
+        """JSON bytes of the message, the same as ``model_dump_json().encode()``."""
+        try:
+            return self._json_cache
+        except AttributeError:
+            data = self.__pydantic_serializer__.to_json(self)
+            # concurrent first calls serialize the same values, either result can be kept
+            object.__setattr__(self, "_json_cache", data)
+
+            return data
+
+    def json_view(self) -> memoryview:
+        """Read-only zero-copy view of the cached JSON bytes, e.g. for socket or queue writes."""
+        return memoryview(self.json_bytes())
@@ -0,0 +1,31 @@
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(
+    module_name: str,
+    exports: dict[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build the module ``__getattr__`` and ``__dir__`` that import each exported name on first access.
+
+    Args:
+        module_name: Name of the module exporting the names, usually ``__name__``.
+        exports: Exported name to the name of the module defining it.
+    """
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        if name not in exports:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(exports[name]), name)
+        # later lookups find the name in the module dict and skip __getattr__
+        setattr(sys.modules[module_name], name, value)
+
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted({*vars(sys.modules[module_name]), *exports})
+
+    return __getattr__, __dir__
@@ -0,0 +1,11 @@
+import math
+from collections.abc import Sequence
+
+
+def percentile(values: Sequence[float], fraction: float) -> float | None:
+    """Nearest-rank percentile of sorted values, None when there are none."""
+    if not values:
+        return None
+
+    # the smallest value with at least the fraction of the values at or below it
+    return values[max(math.ceil(len(values) * fraction) - 1, 0)]
@@ -0,0 +1,99 @@
+from typing import TYPE_CHECKING
+
+from event_models._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from event_models.action.action import (
+        ActionData,
+        ActionError,
+        ActionLogBase,
+        ActionLogRecord,
+        ActionLogSchema,
+        ActionSchema,
+        ActionStatus,
+        PriceMarkup,
+        SplitType,
+        StockType,
+        SyncedActionLogSchema,
+        UnsyncedActionLogSchema,
+    )
+    from event_models.action.batch import (
+        dump_action_logs_json,
+        dump_actions_json,
+        validate_action_logs,
+        validate_action_logs_json,
+        validate_actions,
+        validate_actions_json,
+    )
+    from event_models.action.pricing import (
+        MarkupType,
+        PriceBase,
+        PriceRounding,
+        PricingRule,
+        compute_price,
+        compute_prices,
+    )
+    from event_models.action.sync import PendingSync, SyncQueue, SyncQueueConfig
+
+__all__ = [
+    "ActionData",
+    "ActionError",
+    "ActionLogBase",
+    "ActionLogRecord",
+    "ActionLogSchema",
+    "ActionSchema",
+    "ActionStatus",
+    "MarkupType",
+    "PendingSync",
+    "PriceBase",
+    "PriceMarkup",
+    "PriceRounding",
+    "PricingRule",
+    "SplitType",
+    "StockType",
+    "SyncQueue",
+    "SyncQueueConfig",
+    "SyncedActionLogSchema",
+    "UnsyncedActionLogSchema",
+    "compute_price",
+    "compute_prices",
+    "dump_action_logs_json",
+    "dump_actions_json",
+    "validate_action_logs",
+    "validate_action_logs_json",
+    "validate_actions",
+    "validate_actions_json",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ActionData": "event_models.action.action",
+        "ActionError": "event_models.action.action",
+        "ActionLogBase": "event_models.action.action",
+        "ActionLogRecord": "event_models.action.action",
+        "ActionLogSchema": "event_models.action.action",
+        "ActionSchema": "event_models.action.action",
+        "ActionStatus": "event_models.action.action",
+        "PriceMarkup": "event_models.action.action",
+        "SplitType": "event_models.action.action",
+        "StockType": "event_models.action.action",
+        "SyncedActionLogSchema": "event_models.action.action",
+        "UnsyncedActionLogSchema": "event_models.action.action",
+        "dump_action_logs_json": "event_models.action.batch",
+        "dump_actions_json": "event_models.action.batch",
+        "validate_action_logs": "event_models.action.batch",
+        "validate_action_logs_json": "event_models.action.batch",
+        "validate_actions": "event_models.action.batch",
+        "validate_actions_json": "event_models.action.batch",
+        "MarkupType": "event_models.action.pricing",
+        "PriceBase": "event_models.action.pricing",
+        "PriceRounding": "event_models.action.pricing",
+        "PricingRule": "event_models.action.pricing",
+        "compute_price": "event_models.action.pricing",
+        "compute_prices": "event_models.action.pricing",
+        "PendingSync": "event_models.action.sync",
+        "SyncQueue": "event_models.action.sync",
+        "SyncQueueConfig": "event_models.action.sync",
+    },
+)
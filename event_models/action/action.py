@@ -2,11 +2,13 @@ import datetime
 import enum
 from collections import defaultdict
 from decimal import Decimal
-from typing import Annotated, Any, Optional
+from typing import Annotated, Any, ClassVar, Literal, Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, GetCoreSchemaHandler, model_validator
+from pydantic_core import CoreSchema, core_schema
 
 from event_models.exchange.exchange import EventExchange
+from event_models.profiling.profiling import profiled_validator
 
 type PriceMarkup = defaultdict[
     EventExchange,
@@ -67,6 +69,11 @@ class ActionData(BaseModel):
         description="Per-exchange price markup",
     )
 
+    # strings repeated across listings, see intern_model
+    interned_fields: ClassVar[tuple[str, ...]] = ("source_id", "section", "row", "tags")
+
+    model_config = ConfigDict(defer_build=True)
+
 
 class ActionSchema(BaseModel):
     action_id: int
@@ -81,8 +88,10 @@ class ActionSchema(BaseModel):
     exchange_rules: list[str] | None = None
     external_mapping: dict[EventExchange, int] = {}
 
+    model_config = ConfigDict(defer_build=True)
+
 
-class ActionLogSchema(BaseModel):
+class ActionLogBase(BaseModel):
     action_id: int
     action_exchange_id: str
     action_exchange: EventExchange
@@ -92,7 +101,22 @@ class ActionLogSchema(BaseModel):
     error: dict[datetime.datetime, str] | None = None
     error_code: ActionError | None = None
 
+    model_config = ConfigDict(defer_build=True)
+
+    def to_action_log_schema(self) -> "ActionLogSchema":
+        """ActionLogSchema with the same values, e.g. for the records of ``validate_action_logs``.
+
+        The values were validated by the same rule, so they are not validated again.
+        """
+        if isinstance(self, ActionLogSchema):
+            return self
+
+        return ActionLogSchema.model_construct(_fields_set=set(self.model_fields_set), **self.__dict__)
+
+
+class ActionLogSchema(ActionLogBase):
     @model_validator(mode="before")
+    @profiled_validator
     def check_error(cls: Any, values: Any) -> Any:
         synced = values.get("synced")
 
@@ -105,3 +129,110 @@ class ActionLogSchema(BaseModel):
                 raise ValueError("Sync time is cant be set when sync is set to False")
 
         return values
+
+
+class _SyncedFlag:
+    """Validation of ``synced`` matching the ``synced is True`` check of ActionLogSchema.check_error.
+
+    Only the exact True value is synced, any other value accepted by the lax bool validation is not - e.g. 1 becomes an
+    unsynced True like in ActionLogSchema. Built from pydantic-core schemas, a Python validator per row would cost
+    more than the model validator it replaces.
+    """
+
+    def __init__(self, synced: bool) -> None:
+        self.synced = synced
+
+    def __get_pydantic_core_schema__(self, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        exact = core_schema.chain_schema(
+            [core_schema.bool_schema(strict=True), core_schema.literal_schema([self.synced])],
+        )
+
+        if self.synced:
+            return exact
+
+        # the strict schemas do not accept bools, so a True instance is rejected
+        coerced = core_schema.chain_schema(
+            [
+                core_schema.union_schema(
+                    [
+                        core_schema.int_schema(strict=True),
+                        core_schema.float_schema(strict=True),
+                        core_schema.str_schema(strict=True),
+                        core_schema.decimal_schema(strict=True),
+                    ],
+                ),
+                core_schema.bool_schema(),
+            ],
+        )
+
+        return core_schema.union_schema([exact, coerced], mode="left_to_right")
+
+
+class _SyncTime:
+    """Validation of ``sync_time`` matching the truthiness checks of ActionLogSchema.check_error.
+
+    The only falsy values the datetime validation accepts are numeric zeros, so a synced row rejects them and an
+    unsynced row accepts them besides None - e.g. 0 becomes the epoch like in ActionLogSchema.
+    """
+
+    def __init__(self, synced: bool) -> None:
+        self.synced = synced
+
+    def __get_pydantic_core_schema__(self, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        datetime_schema = handler(source)
+
+        if self.synced:
+            # the strict number schemas do not accept bools, which the datetime validation rejects anyway
+            non_zero = core_schema.union_schema(
+                [
+                    core_schema.str_schema(strict=True),
+                    core_schema.is_instance_schema(datetime.date),
+                    core_schema.bytes_schema(strict=True),
+                    core_schema.int_schema(strict=True, gt=0),
+                    core_schema.int_schema(strict=True, lt=0),
+                    core_schema.float_schema(strict=True, gt=0),
+                    core_schema.float_schema(strict=True, lt=0),
+                    core_schema.decimal_schema(strict=True, gt=Decimal(0)),
+                    core_schema.decimal_schema(strict=True, lt=Decimal(0)),
+                ],
+                mode="left_to_right",
+            )
+
+            return core_schema.chain_schema([non_zero, datetime_schema])
+
+        zero_number = (
+            core_schema.int_schema(strict=True, ge=0, le=0),
+            core_schema.float_schema(strict=True, ge=0, le=0),
+        )
+        # strict decimals accept strings in JSON, a "0" string is truthy
+        zero = core_schema.json_or_python_schema(
+            json_schema=core_schema.union_schema([*zero_number]),
+            python_schema=core_schema.union_schema(
+                [*zero_number, core_schema.decimal_schema(strict=True, ge=Decimal(0), le=Decimal(0))]
+            ),
+        )
+
+        return core_schema.union_schema(
+            [core_schema.none_schema(), core_schema.chain_schema([zero, datetime_schema])],
+            mode="left_to_right",
+        )
+
+
+# Same rule as ActionLogSchema.check_error, expressed by the field types so that batches validate without a Python
+# callback per row - see ActionLogRecord
+class SyncedActionLogSchema(ActionLogBase):
+    synced: Annotated[Literal[True], _SyncedFlag(True)]
+    sync_time: Annotated[datetime.datetime, _SyncTime(True)]
+
+
+class UnsyncedActionLogSchema(ActionLogBase):
+    synced: Annotated[bool, _SyncedFlag(False)]
+    sync_time: Annotated[datetime.datetime | None, _SyncTime(False)] = None
+
+
+# a Literal[True] tag would route 1 to SyncedActionLogSchema and a callable tag materializes JSON rows as Python
+# objects, so the models are tried in order instead
+type ActionLogRecord = Annotated[
+    SyncedActionLogSchema | UnsyncedActionLogSchema,
+    Field(union_mode="left_to_right"),
+]
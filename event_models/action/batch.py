@@ -0,0 +1,63 @@
+from collections.abc import Iterable
+from functools import cache
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from event_models.action.action import ActionLogBase, ActionLogRecord, ActionSchema
+from event_models.intern.intern import active_pool, intern_model
+
+
+@cache
+def action_list_adapter() -> TypeAdapter[list[ActionSchema]]:
+    return TypeAdapter(list[ActionSchema])
+
+
+@cache
+def action_log_list_adapter() -> TypeAdapter[list[ActionLogRecord]]:
+    return TypeAdapter(list[ActionLogRecord])
+
+
+@cache
+def _action_log_dump_adapter() -> TypeAdapter[list[ActionLogBase]]:
+    # all action log classes share the ActionLogBase fields, so any mix of them serializes the same way
+    return TypeAdapter(list[ActionLogBase])
+
+
+def validate_actions(rows: Iterable[Any]) -> list[ActionSchema]:
+    return _intern_actions(action_list_adapter().validate_python(list(rows)))
+
+
+def validate_actions_json(data: str | bytes | bytearray) -> list[ActionSchema]:
+    return _intern_actions(action_list_adapter().validate_json(data))
+
+
+def dump_actions_json(actions: Iterable[ActionSchema]) -> bytes:
+    return action_list_adapter().dump_json(list(actions))
+
+
+def validate_action_logs(rows: Iterable[Any]) -> list[ActionLogRecord]:
+    """Validate action logs, the sync time rule of ActionLogSchema is checked without a Python validator per row.
+
+    Accepts and rejects the same rows as ActionLogSchema. Rows become SyncedActionLogSchema instances when ``synced``
+    is exactly True and UnsyncedActionLogSchema instances otherwise - both share the ActionLogBase fields, use
+    ``to_action_log_schema`` where an ActionLogSchema is required.
+    """
+    return action_log_list_adapter().validate_python(list(rows))
+
+
+def validate_action_logs_json(data: str | bytes | bytearray) -> list[ActionLogRecord]:
+    return action_log_list_adapter().validate_json(data)
+
+
+def dump_action_logs_json(action_logs: Iterable[ActionLogBase]) -> bytes:
+    return _action_log_dump_adapter().dump_json(list(action_logs))
+
+
+def _intern_actions(actions: list[ActionSchema]) -> list[ActionSchema]:
+    if active_pool() is not None:
+        for action in actions:
+            if action.data is not None:
+                intern_model(action.data)
+
+    return actions
@@ -0,0 +1,187 @@
+import decimal
+import enum
+import itertools
+import operator
+from collections.abc import Iterable, Sequence
+from decimal import Decimal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from event_models.action.action import ActionData, ActionSchema
+from event_models.exchange.exchange import EventExchange
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - numpy is optional, the conversion to integers runs in Python without it
+    HAS_NUMPY = False
+
+# prices below this many units convert exactly through a float, with margin for the scaling error
+_FLOAT_EXACT_UNITS = float(2**50)
+
+type PriceKey = tuple[int, EventExchange]
+
+
+class MarkupType(enum.Enum):
+    # final = base + markup
+    ABSOLUTE = "ABSOLUTE"
+    # final = base * (100 + markup) / 100
+    PERCENTAGE = "PERCENTAGE"
+
+
+class PriceBase(enum.Enum):
+    LISTING = "listing_price"
+    ORIGINAL = "original_price"
+
+
+class PriceRounding(enum.StrEnum):
+    # values are the rounding constants of the decimal module
+    UP = decimal.ROUND_UP
+    DOWN = decimal.ROUND_DOWN
+    CEILING = decimal.ROUND_CEILING
+    FLOOR = decimal.ROUND_FLOOR
+    HALF_UP = decimal.ROUND_HALF_UP
+    HALF_DOWN = decimal.ROUND_HALF_DOWN
+    HALF_EVEN = decimal.ROUND_HALF_EVEN
+
+
+class PricingRule(BaseModel):
+    markup_type: MarkupType = MarkupType.ABSOLUTE
+    base: PriceBase = PriceBase.LISTING
+    rounding: PriceRounding = PriceRounding.HALF_UP
+    # number of decimal places of the final price, 2 -> integer cents
+    scale: int = Field(default=2, ge=0, le=9)
+
+    model_config = ConfigDict(frozen=True)
+
+    @property
+    def quantum(self) -> Decimal:
+        return Decimal(1).scaleb(-self.scale)
+
+
+DEFAULT_PRICING_RULE = PricingRule()
+
+
+def compute_price(
+    data: ActionData,
+    exchange: EventExchange,
+    rule: PricingRule = DEFAULT_PRICING_RULE,
+) -> Decimal:
+    """Reference Decimal implementation of the per-exchange price.
+
+    The batch functions return exactly ``compute_price(...).scaleb(rule.scale)`` as an integer.
+    """
+    # .get - do not insert missing exchanges into the defaultdict
+    return _apply_markup(getattr(data, rule.base.value), data.price_markup.get(exchange, Decimal()), rule)
+
+
+def compute_prices(
+    records: Iterable[ActionData | ActionSchema],
+    exchanges: Iterable[EventExchange] | None = None,
+    rule: PricingRule = DEFAULT_PRICING_RULE,
+    use_numpy: bool | None = None,
+) -> dict[PriceKey, int]:
+    """Compute final per-exchange prices for a batch of listings in integer units of ``rule.quantum``.
+
+    Args:
+        records: Action data, or action schemas - schemas without data are skipped.
+        exchanges: Exchanges to price every listing for. Defaults to the exchanges present in each
+            listing's ``price_markup``; missing markups count as zero, like the defaultdict does.
+        rule: Markup and rounding rule, results match ``compute_price`` for the same rule.
+        use_numpy: Enable or disable the NumPy conversion to integers. Defaults to NumPy when installed.
+
+    Returns:
+        Price per ``(listing_id, exchange)``, e.g. cents for the default rule.
+    """
+    if use_numpy and not HAS_NUMPY:
+        raise ValueError("NumPy is not installed")
+
+    keys, bases, markups = _collect(records, exchanges, rule)
+    quantum = rule.quantum
+    rounding = rule.rounding.value
+
+    # the arithmetic stays in Decimal so rounding matches compute_price exactly, only the lookups are batched
+    if rule.markup_type is MarkupType.ABSOLUTE:
+        prices = [(base + markup).quantize(quantum, rounding) for base, markup in zip(bases, markups, strict=True)]
+    else:
+        hundred = Decimal(100)
+        prices = [
+            (base * (hundred + markup)).scaleb(-2).quantize(quantum, rounding)
+            for base, markup in zip(bases, markups, strict=True)
+        ]
+
+    vectorize = HAS_NUMPY if use_numpy is None else use_numpy
+
+    return dict(zip(keys, _to_units(prices, rule.scale, vectorize), strict=True))
+
+
+def units_to_decimal(value: int, rule: PricingRule = DEFAULT_PRICING_RULE) -> Decimal:
+    return Decimal(value).scaleb(-rule.scale)
+
+
+def _collect(
+    records: Iterable[ActionData | ActionSchema],
+    exchanges: Iterable[EventExchange] | None,
+    rule: PricingRule,
+) -> tuple[list[PriceKey], list[Decimal], list[Decimal]]:
+    # isinstance is slow for pydantic models, plain ActionData is checked by type first
+    listings = [
+        data
+        for data in (
+            record if type(record) is ActionData or not isinstance(record, ActionSchema) else record.data
+            for record in records
+        )
+        if data is not None
+    ]
+    base_price = operator.attrgetter(rule.base.value)
+
+    if exchanges is not None:
+        fixed_exchanges = list(exchanges)
+        zero = Decimal()
+
+        keys = list(itertools.product([data.listing_id for data in listings], fixed_exchanges))
+        bases = [base for base in map(base_price, listings) for _ in fixed_exchanges]
+        # .get - do not insert missing exchanges into the defaultdicts
+        markups = [data.price_markup.get(exchange, zero) for data in listings for exchange in fixed_exchanges]
+    else:
+        items = [list(data.price_markup.items()) for data in listings]
+
+        keys = [(data.listing_id, exchange) for data, pairs in zip(listings, items) for exchange, _ in pairs]
+        bases = [base for base, pairs in zip(map(base_price, listings), items) for _ in pairs]
+        markups = [markup for pairs in items for _, markup in pairs]
+
+    return keys, bases, markups
+
+
+def _to_units(prices: Sequence[Decimal], scale: int, vectorize: bool) -> list[int]:
+    """Convert prices quantized to ``scale`` decimal places to integers.
+
+    A quantized price is n / 10 ** scale, its float is within half a unit of n while |n| < 2 ** 51, so rounding the
+    scaled float gives n exactly. Larger or non-finite prices are converted exactly from the Decimal.
+    """
+    factor = 10**scale
+
+    if vectorize:
+        scaled = np.fromiter(map(float, prices), dtype=np.float64, count=len(prices)) * factor
+
+        # a NaN fails the comparison too
+        if bool(np.all(np.abs(scaled) < _FLOAT_EXACT_UNITS)):
+            return np.rint(scaled).astype(np.int64).tolist()  # type: ignore[no-any-return]
+    else:
+        floats = list(map(float, prices))
+
+        if all(map(_FLOAT_EXACT_UNITS.__gt__, map(abs, floats))):
+            return [round(value * factor) for value in floats]
+
+    return [int(price.scaleb(scale)) for price in prices]
+
+
+def _apply_markup(base: Decimal, markup: Decimal, rule: PricingRule) -> Decimal:
+    if rule.markup_type is MarkupType.ABSOLUTE:
+        price = base + markup
+    else:
+        # scaleb is exact, unlike a division by 100 in the default context
+        price = (base * (100 + markup)).scaleb(-2)
+
+    return price.quantize(rule.quantum, rounding=rule.rounding.value)
@@ -0,0 +1,198 @@
+import datetime
+
+from pydantic import BaseModel, ConfigDict, NonNegativeInt, PositiveInt
+
+from event_models.action.action import ActionError, ActionLogSchema, ActionSchema, ActionStatus
+from event_models.exchange.exchange import EventExchange
+
+type SyncKey = tuple[EventExchange, str]
+
+DEFAULT_TERMINAL_STATUSES = frozenset({ActionStatus.SOLD, ActionStatus.REMOVED, ActionStatus.EXPIRED})
+
+
+class SyncQueueConfig(BaseModel):
+    max_batch_size: PositiveInt = 100
+    # overrides max_batch_size for exchanges with a different API limit
+    exchange_batch_size: dict[EventExchange, PositiveInt] = {}
+    max_attempts: PositiveInt = 5
+    retry_delay: datetime.timedelta = datetime.timedelta(seconds=5)
+    max_retry_delay: datetime.timedelta = datetime.timedelta(minutes=5)
+    # once queued, these states are not superseded by a later non-terminal update
+    terminal_statuses: frozenset[ActionStatus] = DEFAULT_TERMINAL_STATUSES
+    # a retry cannot fix these errors
+    non_retryable_errors: frozenset[ActionError] = frozenset({ActionError.MISSING_MAPPING})
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
+    def batch_size(self, exchange: EventExchange) -> int:
+        return self.exchange_batch_size.get(exchange, self.max_batch_size)
+
+
+class PendingSync(BaseModel):
+    action: ActionSchema
+    action_exchange: EventExchange
+    action_exchange_id: str
+    # number of failed sync attempts
+    attempts: NonNegativeInt = 0
+    not_before: datetime.datetime | None = None
+    # number of queued updates this sync replaced
+    coalesced: NonNegativeInt = 0
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
+    @property
+    def key(self) -> SyncKey:
+        return self.action_exchange, self.action_exchange_id
+
+
+class SyncQueue:
+    """Coalescing queue of per-exchange action syncs.
+
+    Pending syncs are keyed by (action_exchange, action_exchange_id), a newer update replaces the queued one unless
+    the queued one is in a terminal state. Each key has at most one sync in flight.
+    """
+
+    def __init__(self, config: SyncQueueConfig | None = None) -> None:
+        self.config = config or SyncQueueConfig()
+
+        # dicts keep insertion order, a coalesced update keeps the queue position of the update it replaces
+        self._pending: dict[EventExchange, dict[str, PendingSync]] = {}
+        self._in_flight: dict[SyncKey, PendingSync] = {}
+
+    def __len__(self) -> int:
+        return sum(len(pending) for pending in self._pending.values())
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def submit(
+        self,
+        action: ActionSchema,
+        exchange: EventExchange,
+        action_exchange_id: str | None = None,
+    ) -> bool:
+        """Queue a sync of the action state to the exchange.
+
+        Returns:
+            False if the update was coalesced with an already queued sync of the same listing.
+        """
+        action_exchange_id = action_exchange_id or action.action_exchange_id
+
+        if not action_exchange_id:
+            raise ValueError(f"Action {action.action_id} has no exchange identifier for {exchange}")
+
+        pending = self._pending.setdefault(exchange, {})
+        update = PendingSync(action=action, action_exchange=exchange, action_exchange_id=action_exchange_id)
+
+        if (queued := pending.get(action_exchange_id)) is None:
+            pending[action_exchange_id] = update
+            return True
+
+        pending[action_exchange_id] = self._coalesce(queued, update)
+        return False
+
+    def ready_exchanges(self, now: datetime.datetime | None = None) -> list[EventExchange]:
+        now = now or datetime.datetime.now()
+
+        return [
+            exchange
+            for exchange, pending in self._pending.items()
+            if any(self._is_ready(item, now) for item in pending.values())
+        ]
+
+    def next_batch(self, exchange: EventExchange, now: datetime.datetime | None = None) -> list[PendingSync]:
+        """Take up to the exchange batch size of ready syncs, they stay in flight until completed or failed."""
+        now = now or datetime.datetime.now()
+        pending = self._pending.get(exchange, {})
+        batch: list[PendingSync] = []
+        limit = self.config.batch_size(exchange)
+
+        for item in pending.values():
+            if len(batch) >= limit:
+                break
+
+            if self._is_ready(item, now):
+                batch.append(item)
+
+        for item in batch:
+            del pending[item.action_exchange_id]
+            self._in_flight[item.key] = item
+
+        return batch
+
+    def complete(self, item: PendingSync, sync_time: datetime.datetime | None = None) -> ActionLogSchema:
+        self._in_flight.pop(item.key, None)
+
+        if item.action.action in self.config.terminal_statuses:
+            # updates queued after a terminal state was synced are stale
+            pending = self._pending.get(item.action_exchange, {})
+            queued = pending.get(item.action_exchange_id)
+
+            if queued is not None and queued.action.action not in self.config.terminal_statuses:
+                del pending[item.action_exchange_id]
+
+        return ActionLogSchema(
+            action_id=item.action.action_id,
+            action_exchange_id=item.action_exchange_id,
+            action_exchange=item.action_exchange,
+            sync_time=sync_time or datetime.datetime.now(),
+            synced=True,
+        )
+
+    def fail(
+        self,
+        item: PendingSync,
+        error_code: ActionError,
+        message: str,
+        retryable: bool = True,
+        now: datetime.datetime | None = None,
+    ) -> ActionLogSchema:
+        """Record a failed sync and schedule its retry when the error and the attempt count allow it."""
+        now = now or datetime.datetime.now()
+        self._in_flight.pop(item.key, None)
+
+        attempts = item.attempts + 1
+        retryable = (
+            retryable and error_code not in self.config.non_retryable_errors and attempts < self.config.max_attempts
+        )
+
+        if retryable:
+            retry = item.model_copy(update={"attempts": attempts, "not_before": now + self._retry_delay(attempts)})
+            pending = self._pending.setdefault(item.action_exchange, {})
+
+            if (queued := pending.get(item.action_exchange_id)) is None:
+                pending[item.action_exchange_id] = retry
+            else:
+                # an update queued meanwhile supersedes the retry unless the retry is in a terminal state
+                pending[item.action_exchange_id] = self._coalesce(retry, queued)
+
+        return ActionLogSchema(
+            action_id=item.action.action_id,
+            action_exchange_id=item.action_exchange_id,
+            action_exchange=item.action_exchange,
+            synced=False,
+            retryable=retryable,
+            error={now: message},
+            error_code=error_code,
+        )
+
+    def _coalesce(self, queued: PendingSync, update: PendingSync) -> PendingSync:
+        coalesced = queued.coalesced + update.coalesced + 1
+
+        # terminal states win, otherwise the latest update does
+        if queued.action.action in self.config.terminal_statuses and (
+            update.action.action not in self.config.terminal_statuses
+        ):
+            # the queued sync keeps its retry schedule
+            return queued.model_copy(update={"coalesced": coalesced})
+
+        # a new state starts with a fresh attempt count, the failures were for the replaced one
+        return update.model_copy(update={"attempts": 0, "not_before": None, "coalesced": coalesced})
+
+    def _is_ready(self, item: PendingSync, now: datetime.datetime) -> bool:
+        return item.key not in self._in_flight and (item.not_before is None or item.not_before <= now)
+
+    def _retry_delay(self, attempts: int) -> datetime.timedelta:
+        delay: datetime.timedelta = self.config.retry_delay * 2 ** (attempts - 1)
+        return min(delay, self.config.max_retry_delay)
@@ -0,0 +1,53 @@
+from typing import TYPE_CHECKING
+
+from event_models._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from event_models.available.cache import (
+        AvailabilitySnapshotCache,
+        SnapshotCacheStats,
+        place_dict_fingerprint,
+        raw_hash_fingerprint,
+    )
+    from event_models.available.snapshot import (
+        AvailabilitySnapshot,
+        checkpoint,
+        encode_snapshot,
+        restore,
+        snapshot_path,
+        write_snapshot,
+    )
+    from event_models.available.ticketmaster import TicketmasterEventAvailable, TicketmasterPlaceAvailable
+
+__all__ = [
+    "AvailabilitySnapshot",
+    "AvailabilitySnapshotCache",
+    "SnapshotCacheStats",
+    "TicketmasterEventAvailable",
+    "TicketmasterPlaceAvailable",
+    "checkpoint",
+    "encode_snapshot",
+    "place_dict_fingerprint",
+    "raw_hash_fingerprint",
+    "restore",
+    "snapshot_path",
+    "write_snapshot",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AvailabilitySnapshotCache": "event_models.available.cache",
+        "SnapshotCacheStats": "event_models.available.cache",
+        "place_dict_fingerprint": "event_models.available.cache",
+        "raw_hash_fingerprint": "event_models.available.cache",
+        "AvailabilitySnapshot": "event_models.available.snapshot",
+        "checkpoint": "event_models.available.snapshot",
+        "encode_snapshot": "event_models.available.snapshot",
+        "restore": "event_models.available.snapshot",
+        "snapshot_path": "event_models.available.snapshot",
+        "write_snapshot": "event_models.available.snapshot",
+        "TicketmasterEventAvailable": "event_models.available.ticketmaster",
+        "TicketmasterPlaceAvailable": "event_models.available.ticketmaster",
+    },
+)
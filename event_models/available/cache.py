@@ -0,0 +1,220 @@
+import datetime
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel, ConfigDict, NonNegativeInt
+
+from event_models.available.ticketmaster import TicketmasterEventAvailable
+
+# estimated memory of one decoded TicketmasterPlaceAvailable including its place_id key, see benchmarks/bench_intern.py
+DEFAULT_PLACE_SIZE = 4096
+DEFAULT_EVENT_SIZE = 1024
+
+
+class SnapshotCacheStats(BaseModel):
+    hits: NonNegativeInt = 0
+    misses: NonNegativeInt = 0
+    # decodes skipped because the place dict fingerprint did not change
+    unchanged: NonNegativeInt = 0
+    evictions: NonNegativeInt = 0
+    expirations: NonNegativeInt = 0
+    entries: NonNegativeInt = 0
+    size_bytes: NonNegativeInt = 0
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class _Entry(NamedTuple):
+    snapshot: TicketmasterEventAvailable
+    fingerprint: bytes | None
+    size: int
+    stored: float
+
+
+type RawHash = Mapping[str | bytes, str | bytes]
+
+
+def place_dict_fingerprint(input_dict: dict[str, Any]) -> bytes:
+    """Content fingerprint of a decoded redis availability hash, as passed to ``from_place_dict``."""
+    return hashlib.blake2b(repr(input_dict).encode(), digest_size=16).digest()
+
+
+def raw_hash_fingerprint(raw: RawHash) -> bytes:
+    """Content fingerprint of a raw redis availability hash (HGETALL result), much cheaper than decoding it."""
+    digest = hashlib.blake2b(digest_size=16)
+
+    for place_id, value in raw.items():
+        digest.update(place_id.encode() if isinstance(place_id, str) else place_id)
+        digest.update(b"\0")
+        digest.update(value.encode() if isinstance(value, str) else value)
+        digest.update(b"\0")
+
+    return digest.digest()
+
+
+class AvailabilitySnapshotCache:
+    """In-process cache of decoded event availability snapshots.
+
+    Entries are evicted least recently used first once the estimated size exceeds ``max_bytes``, and expire after
+    ``ttl``. Cached snapshots are shared by all readers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 256 * 2**20,
+        ttl: datetime.timedelta | None = None,
+        place_size: int = DEFAULT_PLACE_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl.total_seconds() if ttl is not None else None
+        self.place_size = place_size
+
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._size = 0
+        self._stats = SnapshotCacheStats()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._entries
+
+    @property
+    def stats(self) -> SnapshotCacheStats:
+        with self._lock:
+            return self._stats.model_copy(update={"entries": len(self._entries), "size_bytes": self._size})
+
+    def estimate_size(self, snapshot: TicketmasterEventAvailable) -> int:
+        return DEFAULT_EVENT_SIZE + self.place_size * len(snapshot.places)
+
+    def get(self, event_id: str) -> TicketmasterEventAvailable | None:
+        with self._lock:
+            entry = self._lookup(event_id)
+
+            if entry is None:
+                self._stats.misses += 1
+                return None
+
+            self._stats.hits += 1
+            return entry.snapshot
+
+    def put(self, snapshot: TicketmasterEventAvailable, fingerprint: bytes | None = None) -> None:
+        size = self.estimate_size(snapshot)
+
+        with self._lock:
+            self._remove(snapshot.event_id)
+
+            if size > self.max_bytes:
+                # would evict everything else and still not fit
+                return
+
+            self._entries[snapshot.event_id] = _Entry(snapshot, fingerprint, size, self._clock())
+            self._size += size
+
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+                self._stats.evictions += 1
+
+    def from_place_dict(
+        self,
+        event_id: str,
+        input_dict: dict[str, Any],
+        fingerprint: bytes | None = None,
+    ) -> TicketmasterEventAvailable:
+        """Decode the redis availability hash unless the cached snapshot was decoded from the same content.
+
+        Args:
+            event_id: Event identifier.
+            input_dict: Redis availability hash, see ``TicketmasterEventAvailable.from_place_dict``.
+            fingerprint: Content fingerprint of the hash, if the caller has a cheaper one than
+                ``place_dict_fingerprint`` - e.g. a digest of the raw redis values.
+        """
+        if fingerprint is None:
+            fingerprint = place_dict_fingerprint(input_dict)
+
+        if (snapshot := self._unchanged(event_id, fingerprint)) is not None:
+            return snapshot
+
+        return self._decode(event_id, input_dict, fingerprint)
+
+    def from_raw_hash(
+        self,
+        event_id: str,
+        raw: RawHash,
+        loads: Callable[[str | bytes], Any] = json.loads,
+    ) -> TicketmasterEventAvailable:
+        """Decode the raw redis availability hash, skipping both the value and the model decoding when unchanged.
+
+        Args:
+            event_id: Event identifier.
+            raw: Raw redis hash of place identifiers to encoded place values.
+            loads: Decoder of a single place value into the list expected by ``from_place_dict``.
+        """
+        fingerprint = raw_hash_fingerprint(raw)
+
+        if (snapshot := self._unchanged(event_id, fingerprint)) is not None:
+            return snapshot
+
+        input_dict = {
+            place_id.decode() if isinstance(place_id, bytes) else place_id: loads(value)
+            for place_id, value in raw.items()
+        }
+
+        return self._decode(event_id, input_dict, fingerprint)
+
+    def invalidate(self, event_id: str) -> None:
+        with self._lock:
+            self._remove(event_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _unchanged(self, event_id: str, fingerprint: bytes) -> TicketmasterEventAvailable | None:
+        with self._lock:
+            entry = self._lookup(event_id)
+
+            if entry is not None and entry.fingerprint == fingerprint:
+                self._stats.hits += 1
+                self._stats.unchanged += 1
+                return entry.snapshot
+
+            self._stats.misses += 1
+            return None
+
+    def _decode(self, event_id: str, input_dict: dict[str, Any], fingerprint: bytes) -> TicketmasterEventAvailable:
+        # decoded outside of the lock, concurrent decodes of the same event store the same content
+        snapshot = TicketmasterEventAvailable.from_place_dict(event_id, input_dict)
+        self.put(snapshot, fingerprint)
+
+        return snapshot
+
+    def _lookup(self, event_id: str) -> _Entry | None:
+        entry = self._entries.get(event_id)
+
+        if entry is None:
+            return None
+
+        if self.ttl is not None and self._clock() - entry.stored > self.ttl:
+            self._remove(event_id)
+            self._stats.expirations += 1
+            return None
+
+        self._entries.move_to_end(event_id)
+        return entry
+
+    def _remove(self, event_id: str) -> None:
+        entry = self._entries.pop(event_id, None)
+
+        if entry is not None:
+            self._size -= entry.size
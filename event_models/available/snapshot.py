@@ -0,0 +1,395 @@
+import datetime
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Callable, Iterable
+from decimal import Decimal
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Literal, Self
+from urllib.parse import quote, unquote
+
+from event_models.available.ticketmaster import TicketmasterEventAvailable, TicketmasterPlaceAvailable
+from event_models.logger.logger import AppLogger
+from event_models.logger.message import LoggerMessage
+
+logger = AppLogger(__name__)
+
+# Snapshot file layout, little-endian:
+#   header      magic, version, flags, number of places, number of strings, event_id string reference
+#   columns     one fixed-width column per field in _COLUMNS order, each padded to 8 bytes
+#   strings     uint32 offsets of the string ends followed by the utf-8 data, each distinct string is stored once
+_MAGIC = b"EVAV"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHIII")
+_ALIGNMENT = 8
+_OLD_SCHEMA_FLAG = 1
+
+SNAPSHOT_SUFFIX = ".evav"
+NULL_INT = -(2**63)
+NULL_STRING = 2**32 - 1
+
+_INT_COLUMNS = ("list_price", "total_price", "count", "row_rank", "seat_rank")
+_STRING_COLUMNS = (
+    "place_id",
+    "offer_id",
+    "offer_name",
+    "inventory_type",
+    "full_section",
+    "section",
+    "row",
+    "seat_number",
+    "update_reason",
+)
+# variable length values stored as their JSON text
+_JSON_COLUMNS = ("sellable_quantities", "attributes", "description")
+_DATETIME_COLUMNS = ("inserted", "prev_updated")
+_COLUMNS: tuple[tuple[str, Literal["q", "B", "I"]], ...] = (
+    *((name, "q") for name in _INT_COLUMNS),
+    ("protected", "B"),
+    *((name, "I") for name in (*_STRING_COLUMNS, *_JSON_COLUMNS, *_DATETIME_COLUMNS)),
+)
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.indexes: dict[str, int] = {}
+
+    def ref(self, value: str | None) -> int:
+        if value is None:
+            return NULL_STRING
+
+        return self.indexes.setdefault(value, len(self.indexes))
+
+    def to_bytes(self) -> bytes:
+        data = [value.encode() for value in self.indexes]
+        ends = array("I")
+        end = 0
+
+        for encoded in data:
+            end += len(encoded)
+            ends.append(end)
+
+        return ends.tobytes() + b"".join(data)
+
+
+def _padding(size: int) -> bytes:
+    return b"\0" * (-size % _ALIGNMENT)
+
+
+def _check_byteorder() -> None:
+    # columns are written and read through native arrays and memoryviews
+    if sys.byteorder != "little":
+        raise ValueError("Availability snapshots are supported on little-endian platforms only")
+
+
+def _cents(value: Decimal) -> int:
+    return int(value.scaleb(2))
+
+
+def _nullable(value: int | None) -> int:
+    return NULL_INT if value is None else value
+
+
+def encode_snapshot(event: TicketmasterEventAvailable) -> bytes:
+    _check_byteorder()
+
+    strings = _StringTable()
+    event_ref = strings.ref(event.event_id)
+    columns = {name: array(typecode) for name, typecode in _COLUMNS}
+
+    for place_id, place in event.places.items():
+        columns["list_price"].append(_cents(place.list_price))
+        columns["total_price"].append(_cents(place.total_price))
+        columns["count"].append(_nullable(place.count))
+        columns["row_rank"].append(_nullable(place.row_rank))
+        columns["seat_rank"].append(_nullable(place.seat_rank))
+        columns["protected"].append(place.protected)
+        columns["place_id"].append(strings.ref(place_id))
+
+        for name in _STRING_COLUMNS[1:]:
+            columns[name].append(strings.ref(getattr(place, name)))
+
+        for name in _JSON_COLUMNS:
+            value = getattr(place, name)
+            columns[name].append(strings.ref(None if value is None else json.dumps(value)))
+
+        for name in _DATETIME_COLUMNS:
+            value = getattr(place, name)
+            columns[name].append(strings.ref(None if value is None else value.isoformat()))
+
+    header = _HEADER.pack(
+        _MAGIC,
+        _VERSION,
+        _OLD_SCHEMA_FLAG if event.old_schema else 0,
+        len(event.places),
+        len(strings.indexes),
+        event_ref,
+    )
+    parts = [header, _padding(len(header))]
+
+    for name, _ in _COLUMNS:
+        data = columns[name].tobytes()
+        parts += [data, _padding(len(data))]
+
+    parts.append(strings.to_bytes())
+
+    return b"".join(parts)
+
+
+def write_snapshot(event: TicketmasterEventAvailable, path: str | os.PathLike[str]) -> None:
+    """Write the event availability snapshot, the file is replaced atomically."""
+    path = Path(path)
+    data = encode_snapshot(event)
+
+    tmp_file = tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name, suffix=".tmp", delete=False)
+
+    try:
+        with tmp_file:
+            tmp_file.write(data)
+            tmp_file.flush()
+            # the data must be on disk before the rename, otherwise a crash can leave an empty snapshot behind
+            os.fsync(tmp_file.fileno())
+
+        os.replace(tmp_file.name, path)
+    except BaseException:
+        Path(tmp_file.name).unlink(missing_ok=True)
+        raise
+
+
+class AvailabilitySnapshot:
+    """Memory-mapped event availability snapshot.
+
+    Price and rank columns are zero-copy memoryviews into the mapped file, prices in integer cents and missing ranks
+    as NULL_INT. The views must be released before the snapshot is closed.
+    """
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        _check_byteorder()
+
+        if len(buffer) < _HEADER.size:
+            raise ValueError(f"Truncated availability snapshot: {len(buffer)} bytes")
+
+        magic, version, flags, places, strings, event_ref = _HEADER.unpack_from(buffer)
+
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Not an availability snapshot of version {_VERSION}: {magic!r} {version}")
+
+        offsets: dict[str, tuple[int, int]] = {}
+        offset = _HEADER.size + len(_padding(_HEADER.size))
+
+        for name, typecode in _COLUMNS:
+            size = places * struct.calcsize(typecode)
+            offsets[name] = offset, offset + size
+            offset += size + len(_padding(size))
+
+        total = offset + 4 * strings
+
+        if strings and len(buffer) >= total:
+            # end offset of the last string
+            total += struct.unpack_from("<I", buffer, total - 4)[0]
+
+        # checked before any view is taken, an mmap with exported views cannot be closed
+        if len(buffer) < total:
+            raise ValueError(f"Truncated availability snapshot: {len(buffer)} bytes, expected {total}")
+
+        self.old_schema = bool(flags & _OLD_SCHEMA_FLAG)
+        self._size: int = places
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self._columns = {
+            name: self._view[start:end].cast(typecode)
+            for (name, typecode), (start, end) in zip(_COLUMNS, offsets.values(), strict=True)
+        }
+
+        self._string_ends = self._view[offset : offset + 4 * strings].cast("I")
+        self._string_data = self._view[offset + 4 * strings :]
+        self.event_id = self.string(event_ref) or ""
+
+    @classmethod
+    def open(cls, path: str | os.PathLike[str]) -> Self:
+        with open(path, "rb") as snapshot_file:
+            buffer = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            return cls(buffer)
+        except BaseException:
+            buffer.close()
+            raise
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for column in self._columns.values():
+            column.release()
+
+        self._string_ends.release()
+        self._string_data.release()
+        self._view.release()
+
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    @property
+    def list_price_cents(self) -> memoryview:
+        return self._columns["list_price"]
+
+    @property
+    def total_price_cents(self) -> memoryview:
+        return self._columns["total_price"]
+
+    @property
+    def row_rank(self) -> memoryview:
+        return self._columns["row_rank"]
+
+    @property
+    def seat_rank(self) -> memoryview:
+        return self._columns["seat_rank"]
+
+    def column(self, name: str) -> memoryview:
+        return self._columns[name]
+
+    def string(self, ref: int) -> str | None:
+        if ref == NULL_STRING:
+            return None
+
+        start = self._string_ends[ref - 1] if ref else 0
+
+        return str(self._string_data[start : self._string_ends[ref]], "utf-8")
+
+    def place_ids(self) -> list[str]:
+        return [self.string(ref) or "" for ref in self._columns["place_id"]]
+
+    def place(self, index: int) -> TicketmasterPlaceAvailable:
+        return self._places(index, index + 1)[0]
+
+    def to_model(self) -> TicketmasterEventAvailable:
+        place_ids = [self.string(ref) or "" for ref in self._columns["place_id"]]
+
+        return TicketmasterEventAvailable.model_construct(
+            event_id=self.event_id,
+            places=dict(zip(place_ids, self._places(0, len(self)), strict=True)),
+            old_schema=self.old_schema,
+        )
+
+    def _places(self, start: int, stop: int) -> list[TicketmasterPlaceAvailable]:
+        columns = {name: self._columns[name][start:stop].tolist() for name, _ in _COLUMNS}
+        # repeated values are decoded once and share the same instance, lists are copied since they are mutable
+        strings: dict[int, Any] = {}
+        decoded: dict[str, list[Any]] = {
+            "list_price": _memoized_map(columns["list_price"], _price, {}),
+            "total_price": _memoized_map(columns["total_price"], _price, {}),
+            "protected": [bool(value) for value in columns["protected"]],
+        }
+
+        for name in ("count", "row_rank", "seat_rank"):
+            decoded[name] = [None if value == NULL_INT else value for value in columns[name]]
+
+        for name in _STRING_COLUMNS[1:]:
+            decoded[name] = _memoized_map(columns[name], self.string, strings)
+
+        json_values: dict[int, Any] = {}
+
+        for name in _JSON_COLUMNS:
+            values = _memoized_map(columns[name], self._json, json_values)
+            decoded[name] = [None if value is None else list(value) for value in values]
+
+        datetimes: dict[int, Any] = {}
+
+        for name in _DATETIME_COLUMNS:
+            decoded[name] = _memoized_map(columns[name], self._datetime, datetimes)
+
+        # pydantic serializes the __dict__ in its order, so it has to follow the field order
+        names = list(TicketmasterPlaceAvailable.model_fields)
+
+        return [
+            _construct_place(dict(zip(names, row, strict=True)))
+            for row in zip(*(decoded[name] for name in names), strict=True)
+        ]
+
+    def _json(self, ref: int) -> Any:
+        text = self.string(ref)
+
+        return None if text is None else json.loads(text)
+
+    def _datetime(self, ref: int) -> datetime.datetime | None:
+        text = self.string(ref)
+
+        return None if text is None else datetime.datetime.fromisoformat(text)
+
+
+def _construct_place(values: dict[str, Any]) -> TicketmasterPlaceAvailable:
+    # same result as model_construct with all fields given, without its per field default handling - the values were
+    # validated before they were written
+    place = TicketmasterPlaceAvailable.__new__(TicketmasterPlaceAvailable)
+    object.__setattr__(place, "__dict__", values)
+    object.__setattr__(place, "__pydantic_fields_set__", set(values))
+    object.__setattr__(place, "__pydantic_extra__", None)
+    object.__setattr__(place, "__pydantic_private__", None)
+
+    return place
+
+
+def _price(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
+
+
+def _memoized_map(values: list[int], decode: Callable[[int], Any], cache: dict[int, Any]) -> list[Any]:
+    return [cache[value] if value in cache else cache.setdefault(value, decode(value)) for value in values]
+
+
+def snapshot_path(directory: str | os.PathLike[str], event_id: str) -> Path:
+    return Path(directory) / f"{quote(event_id, safe='')}{SNAPSHOT_SUFFIX}"
+
+
+def checkpoint(events: Iterable[TicketmasterEventAvailable], directory: str | os.PathLike[str]) -> int:
+    """Write a snapshot file per event into the directory, returns the number of written snapshots."""
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    written = 0
+
+    for event in events:
+        write_snapshot(event, snapshot_path(directory, event.event_id))
+        written += 1
+
+    return written
+
+
+def restore(directory: str | os.PathLike[str]) -> dict[str, AvailabilitySnapshot]:
+    """Map all snapshots of the checkpoint directory, the models are decoded on demand with ``to_model``.
+
+    Unreadable snapshot files, e.g. empty or truncated ones, are logged and skipped.
+    """
+    snapshots: dict[str, AvailabilitySnapshot] = {}
+
+    try:
+        for path in sorted(Path(directory).glob(f"*{SNAPSHOT_SUFFIX}")):
+            try:
+                snapshot = AvailabilitySnapshot.open(path)
+            except (OSError, ValueError):
+                logger.exception(f"Skipping unreadable availability snapshot {path}", message_id=LoggerMessage.SERVICE)
+                continue
+
+            snapshots[unquote(path.name.removesuffix(SNAPSHOT_SUFFIX))] = snapshot
+    except BaseException:
+        for snapshot in snapshots.values():
+            snapshot.close()
+
+        raise
+
+    return snapshots
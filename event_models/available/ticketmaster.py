@@ -1,8 +1,11 @@
 import datetime
 from decimal import Decimal
-from typing import Any
+from typing import Any, ClassVar
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
+
+from event_models.intern.intern import active_pool, intern_model
+from event_models.profiling.profiling import profiled_validator
 
 _ORIGINAL_REDIS_SCHEMA_LEN = 7
 _ORIGINAL_REDIS_SCHEMA_GA_LEN = 8
@@ -48,7 +51,23 @@ class TicketmasterPlaceAvailable(BaseModel):
     prev_updated: datetime.datetime | None
     update_reason: str | None
 
+    # strings repeated across places, see intern_model
+    interned_fields: ClassVar[tuple[str, ...]] = (
+        "offer_id",
+        "offer_name",
+        "inventory_type",
+        "full_section",
+        "section",
+        "row",
+        "update_reason",
+        "attributes",
+        "description",
+    )
+
+    model_config = ConfigDict(defer_build=True)
+
     @field_validator("list_price", "total_price", mode="before")
+    @profiled_validator
     def set_decimal_places(cls, v: Any) -> Decimal:
         if isinstance(v, str):
             return Decimal(f"{float(v):.2f}")
@@ -61,6 +80,8 @@ class TicketmasterEventAvailable(BaseModel):
     places: dict[str, TicketmasterPlaceAvailable]
     old_schema: bool
 
+    model_config = ConfigDict(defer_build=True)
+
     @classmethod
     def from_place_dict(
         cls,
@@ -148,6 +169,10 @@ class TicketmasterEventAvailable(BaseModel):
                 f"Found {origin_count} old schema values and {new_count} new schema values for event {event_id}"
             )
 
+        if active_pool() is not None:
+            for place in places.values():
+                intern_model(place)
+
         return cls(event_id=event_id, places=places, old_schema=origin_count > 0)
 
     def to_redis_dict(self) -> dict[str, Any]:
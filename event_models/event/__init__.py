@@ -0,0 +1,46 @@
+from typing import TYPE_CHECKING
+
+from event_models._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from event_models.event.event import (
+        ArchiveMessage,
+        EventAction,
+        EventMessage,
+        EventSource,
+        EventStoreType,
+        FrozenArchiveMessage,
+        MessageHeader,
+    )
+    from event_models.event.router import EventRouter, Route, RouteConfig, RouteStats
+
+__all__ = [
+    "ArchiveMessage",
+    "EventAction",
+    "EventMessage",
+    "EventRouter",
+    "EventSource",
+    "EventStoreType",
+    "FrozenArchiveMessage",
+    "MessageHeader",
+    "Route",
+    "RouteConfig",
+    "RouteStats",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ArchiveMessage": "event_models.event.event",
+        "EventAction": "event_models.event.event",
+        "EventMessage": "event_models.event.event",
+        "EventSource": "event_models.event.event",
+        "EventStoreType": "event_models.event.event",
+        "FrozenArchiveMessage": "event_models.event.event",
+        "MessageHeader": "event_models.event.event",
+        "EventRouter": "event_models.event.router",
+        "Route": "event_models.event.router",
+        "RouteConfig": "event_models.event.router",
+        "RouteStats": "event_models.event.router",
+    },
+)
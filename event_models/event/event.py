@@ -1,9 +1,12 @@
 import datetime
 import enum
-from typing import Any
+from typing import Any, ClassVar
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from event_models._cached_json import CachedJsonModel
+from event_models.profiling.profiling import profiled_validator
+
 
 # TODO unify with ScrapType from trigger.enum
 class EventSource(enum.StrEnum):
@@ -69,9 +72,13 @@ class MessageHeader(BaseModel):
     not_found: bool | None = Field(default=False, alias="not-found")
     not_on_sale: bool | None = Field(default=False, alias="not-on-sale")
 
-    model_config = ConfigDict(populate_by_name=True)
+    # strings repeated across messages, see intern_model
+    interned_fields: ClassVar[tuple[str, ...]] = ("event_id", "venue_id")
+
+    model_config = ConfigDict(defer_build=True, populate_by_name=True)
 
     @field_validator("event_timestamp", mode="after")
+    @profiled_validator
     def set_default_timezone(cls: Any, v: datetime.datetime) -> datetime.datetime:
         # check if v has timezone info
         if v and v.tzinfo:
@@ -92,9 +99,17 @@ class MessageHeader(BaseModel):
 class EventMessage(BaseModel):
     header: MessageHeader
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ArchiveMessage(BaseModel):
     message_id: str
     venue_id: str
     event_id: str = Field(default="")
     event_timestamp: datetime.datetime
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class FrozenArchiveMessage(ArchiveMessage, CachedJsonModel):
+    pass
@@ -0,0 +1,334 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from types import TracebackType
+from typing import Any, NamedTuple, Self
+
+from pydantic import BaseModel, ConfigDict, NonNegativeFloat, NonNegativeInt, PositiveInt
+
+from event_models._stats import percentile
+from event_models.event.event import EventAction, EventMessage, EventSource, MessageHeader
+from event_models.logger.logger import AppLogger
+from event_models.logger.message import LoggerMessage
+
+logger = AppLogger(__name__)
+
+type MessageHandler = Callable[[EventMessage], Awaitable[Any]]
+
+# number of latest handler latencies kept per route for the percentiles
+LATENCY_WINDOW = 1024
+
+
+class RouteConfig(BaseModel):
+    # maximum number of queued and in-process messages, dispatch waits while the route is full
+    max_queue_size: PositiveInt = 1000
+    workers: PositiveInt = 8
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
+
+class RouteStats(BaseModel):
+    name: str
+    queue_depth: NonNegativeInt
+    in_flight: NonNegativeInt
+    # events with queued or in-process messages
+    active_events: NonNegativeInt
+    processed: NonNegativeInt
+    failed: NonNegativeInt
+    latency_mean: NonNegativeFloat | None
+    latency_p50: NonNegativeFloat | None
+    latency_p99: NonNegativeFloat | None
+    latency_max: NonNegativeFloat | None
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class _RouteKey(NamedTuple):
+    event_action: EventAction
+    event_source: EventSource
+    not_found: bool
+    not_on_sale: bool
+
+
+class Route:
+    """Messages of one route, handled by a pool of workers.
+
+    Messages of the same event are handled one at a time in dispatch order, different events in parallel.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: MessageHandler,
+        event_action: EventAction | None = None,
+        event_source: EventSource | None = None,
+        not_found: bool | None = None,
+        not_on_sale: bool | None = None,
+        config: RouteConfig | None = None,
+    ) -> None:
+        self.name = name
+        self.handler = handler
+        # None matches any value
+        self.criteria = (event_action, event_source, not_found, not_on_sale)
+        self.config = config or RouteConfig()
+
+        # event_id -> messages not yet handled, an event is in the ready queue or in process, never both
+        self._lanes: dict[str, deque[EventMessage]] = {}
+        self._ready: asyncio.Queue[str] = asyncio.Queue()
+        # one token per queued or in-process message
+        self._slots: asyncio.Queue[None] = asyncio.Queue(self.config.max_queue_size)
+        self._workers: list[asyncio.Task[None]] = []
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+        self._queued = 0
+        self._in_flight = 0
+        self._processed = 0
+        self._failed = 0
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._latency_total = 0.0
+        self._latency_max: float | None = None
+
+    @property
+    def specificity(self) -> int:
+        return sum(value is not None for value in self.criteria)
+
+    def matches(self, key: _RouteKey) -> bool:
+        return all(value is None or value == actual for value, actual in zip(self.criteria, key, strict=True))
+
+    @property
+    def stats(self) -> RouteStats:
+        latencies = sorted(self._latencies)
+        handled = self._processed + self._failed
+
+        return RouteStats(
+            name=self.name,
+            queue_depth=self._queued,
+            in_flight=self._in_flight,
+            active_events=len(self._lanes),
+            processed=self._processed,
+            failed=self._failed,
+            latency_mean=self._latency_total / handled if handled else None,
+            latency_p50=percentile(latencies, 0.5),
+            latency_p99=percentile(latencies, 0.99),
+            latency_max=self._latency_max,
+        )
+
+    def start(self) -> None:
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._work(), name=f"{self.name}-{worker}") for worker in range(self.config.workers)
+            ]
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def put(self, message: EventMessage) -> None:
+        await self._slots.put(None)
+        self._enqueue(message)
+
+    def put_nowait(self, message: EventMessage) -> bool:
+        try:
+            self._slots.put_nowait(None)
+        except asyncio.QueueFull:
+            return False
+
+        self._enqueue(message)
+
+        return True
+
+    async def join(self) -> None:
+        await self._idle.wait()
+
+    def _enqueue(self, message: EventMessage) -> None:
+        event_id = message.header.event_id
+        self._queued += 1
+        self._idle.clear()
+
+        if (lane := self._lanes.get(event_id)) is not None:
+            lane.append(message)
+        else:
+            self._lanes[event_id] = deque((message,))
+            self._ready.put_nowait(event_id)
+
+    async def _work(self) -> None:
+        while True:
+            event_id = await self._ready.get()
+            lane = self._lanes[event_id]
+            message = lane.popleft()
+            self._queued -= 1
+            self._in_flight += 1
+            started = time.perf_counter()
+
+            try:
+                await self.handler(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._failed += 1
+                logger.exception(
+                    f"Route {self.name} failed to handle message {message.header.event_message_id}",
+                    message_id=LoggerMessage.SERVICE,
+                )
+            else:
+                self._processed += 1
+            finally:
+                self._record_latency(time.perf_counter() - started)
+                self._in_flight -= 1
+                self._slots.get_nowait()
+
+                if lane:
+                    # back of the ready queue, so that a busy event does not starve the others
+                    self._ready.put_nowait(event_id)
+                else:
+                    del self._lanes[event_id]
+
+                    if not self._lanes:
+                        self._idle.set()
+
+    def _record_latency(self, latency: float) -> None:
+        self._latencies.append(latency)
+        self._latency_total += latency
+
+        if self._latency_max is None or latency > self._latency_max:
+            self._latency_max = latency
+
+
+class EventRouter:
+    """Asyncio router of event messages to handlers by header action, source and availability flags.
+
+    Each message goes to the most specific matching route, the first registered one among equally specific routes.
+    Dispatch waits while the route queue is full, so a consumer reading faster than the handlers keep up is slowed
+    down instead of buffering without bound.
+
+    Example:
+        router = EventRouter()
+        router.register(store_handler, event_action=EventAction.STORE)
+        router.register(archive_handler, event_action=EventAction.ARCHIVE, config=RouteConfig(workers=1))
+
+        async with router:
+            async for message in consumer:
+                await router.dispatch(message)
+    """
+
+    def __init__(self, default_config: RouteConfig | None = None) -> None:
+        self.default_config = default_config or RouteConfig()
+
+        self._routes: list[Route] = []
+        self._resolved: dict[_RouteKey, Route | None] = {}
+        self._started = False
+
+    @property
+    def routes(self) -> list[Route]:
+        return list(self._routes)
+
+    def register(
+        self,
+        handler: MessageHandler,
+        event_action: EventAction | None = None,
+        event_source: EventSource | None = None,
+        not_found: bool | None = None,
+        not_on_sale: bool | None = None,
+        name: str | None = None,
+        config: RouteConfig | None = None,
+    ) -> Route:
+        """Register the handler for messages matching all given header values, None matches any value."""
+        if name is None:
+            parts = [str(value) if value is not None else "*" for value in (event_action, event_source)]
+            flags = {"not_found": not_found, "not_on_sale": not_on_sale}
+            name = "/".join(parts + [f"{flag}={value}" for flag, value in flags.items() if value is not None])
+
+        if any(route.name == name for route in self._routes):
+            raise ValueError(f"Route {name} is already registered")
+
+        route = Route(name, handler, event_action, event_source, not_found, not_on_sale, config or self.default_config)
+        self._routes.append(route)
+        self._resolved.clear()
+
+        if self._started:
+            route.start()
+
+        return route
+
+    def route(
+        self,
+        event_action: EventAction | None = None,
+        event_source: EventSource | None = None,
+        not_found: bool | None = None,
+        not_on_sale: bool | None = None,
+        name: str | None = None,
+        config: RouteConfig | None = None,
+    ) -> Callable[[MessageHandler], MessageHandler]:
+        """Decorator form of ``register``."""
+
+        def decorator(handler: MessageHandler) -> MessageHandler:
+            self.register(handler, event_action, event_source, not_found, not_on_sale, name, config)
+            return handler
+
+        return decorator
+
+    def resolve(self, header: MessageHeader) -> Route | None:
+        key = _RouteKey(header.event_action, header.event_source, bool(header.not_found), bool(header.not_on_sale))
+
+        try:
+            return self._resolved[key]
+        except KeyError:
+            # max keeps the first of equally specific routes
+            matching = [route for route in self._routes if route.matches(key)]
+            resolved = max(matching, key=lambda route: route.specificity, default=None)
+            self._resolved[key] = resolved
+
+            return resolved
+
+    async def dispatch(self, message: EventMessage) -> None:
+        """Queue the message on its route, waiting while the route queue is full."""
+        await self._route(message).put(message)
+
+    def try_dispatch(self, message: EventMessage) -> bool:
+        """Queue the message on its route without waiting, returns False when the route queue is full."""
+        return self._route(message).put_nowait(message)
+
+    def stats(self) -> list[RouteStats]:
+        return [route.stats for route in self._routes]
+
+    async def start(self) -> None:
+        self._started = True
+
+        for route in self._routes:
+            route.start()
+
+    async def join(self) -> None:
+        """Wait until all queued messages were handled."""
+        await asyncio.gather(*(route.join() for route in self._routes))
+
+    async def close(self, drain: bool = True) -> None:
+        if drain:
+            await self.join()
+
+        self._started = False
+        await asyncio.gather(*(route.stop() for route in self._routes))
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        # do not wait for queued messages when leaving because of an error
+        await self.close(drain=exc_type is None)
+
+    def _route(self, message: EventMessage) -> Route:
+        if (route := self.resolve(message.header)) is None:
+            header = message.header
+            raise ValueError(f"No route for {header.event_action} message from {header.event_source}")
+
+        return route
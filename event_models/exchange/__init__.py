@@ -0,0 +1,17 @@
+from typing import TYPE_CHECKING
+
+from event_models._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from event_models.exchange.exchange import EventExchange
+
+__all__ = [
+    "EventExchange",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "EventExchange": "event_models.exchange.exchange",
+    },
+)
@@ -0,0 +1,37 @@
+from typing import TYPE_CHECKING
+
+from event_models._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from event_models.intern.intern import (
+        EventInternPools,
+        InternPool,
+        active_pool,
+        disable_interning,
+        enable_interning,
+        intern_model,
+        interning,
+    )
+
+__all__ = [
+    "EventInternPools",
+    "InternPool",
+    "active_pool",
+    "disable_interning",
+    "enable_interning",
+    "intern_model",
+    "interning",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "EventInternPools": "event_models.intern.intern",
+        "InternPool": "event_models.intern.intern",
+        "active_pool": "event_models.intern.intern",
+        "disable_interning": "event_models.intern.intern",
+        "enable_interning": "event_models.intern.intern",
+        "intern_model": "event_models.intern.intern",
+        "interning": "event_models.intern.intern",
+    },
+)
@@ -0,0 +1,145 @@
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from pydantic import BaseModel
+
+
+class InternPool:
+    """Bounded pool of canonical strings, the least recently used ones are evicted first.
+
+    Pools are not thread-safe, use one pool per thread or per event.
+    """
+
+    def __init__(self, max_size: int = 65_536) -> None:
+        if max_size <= 0:
+            raise ValueError(f"Intern pool size must be positive: {max_size}")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._strings: OrderedDict[str, str] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def intern(self, value: str) -> str:
+        strings = self._strings
+        canonical = strings.get(value)
+
+        if canonical is not None:
+            strings.move_to_end(value)
+            self.hits += 1
+            return canonical
+
+        self.misses += 1
+        strings[value] = value
+
+        if len(strings) > self.max_size:
+            strings.popitem(last=False)
+            self.evictions += 1
+
+        return value
+
+    def clear(self) -> None:
+        self._strings.clear()
+
+
+class EventInternPools:
+    """Intern pools per event, pools of the least recently used events are dropped first."""
+
+    def __init__(self, max_events: int = 256, max_size: int = 16_384) -> None:
+        if max_events <= 0:
+            raise ValueError(f"Number of event pools must be positive: {max_events}")
+
+        self.max_events = max_events
+        self.max_size = max_size
+
+        self._pools: OrderedDict[str, InternPool] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._pools)
+
+    def pool(self, event_id: str) -> InternPool:
+        pool = self._pools.get(event_id)
+
+        if pool is not None:
+            self._pools.move_to_end(event_id)
+            return pool
+
+        pool = self._pools[event_id] = InternPool(self.max_size)
+
+        if len(self._pools) > self.max_events:
+            self._pools.popitem(last=False)
+
+        return pool
+
+    def discard(self, event_id: str) -> None:
+        self._pools.pop(event_id, None)
+
+
+_active_pool: ContextVar[InternPool | None] = ContextVar("event_models_intern_pool", default=None)
+_default_pool: InternPool | None = None
+
+
+@contextmanager
+def interning(pool: InternPool) -> Iterator[InternPool]:
+    """Intern the strings of the models decoded in this context into the pool, see ``intern_model``."""
+    token = _active_pool.set(pool)
+
+    try:
+        yield pool
+    finally:
+        _active_pool.reset(token)
+
+
+def enable_interning(pool: InternPool | None = None) -> InternPool:
+    """Intern the strings of the models decoded outside of an ``interning`` context into a process-wide pool."""
+    global _default_pool
+
+    _default_pool = InternPool() if pool is None else pool
+
+    return _default_pool
+
+
+def disable_interning() -> None:
+    global _default_pool
+
+    _default_pool = None
+
+
+def active_pool() -> InternPool | None:
+    pool = _active_pool.get()
+
+    return _default_pool if pool is None else pool
+
+
+def intern_model[M: BaseModel](model: M) -> M:
+    """Intern the ``interned_fields`` strings of a validated model into the active pool.
+
+    Interning is not part of the validation, so it costs nothing while no pool is active. The decoders
+    ``TicketmasterEventAvailable.from_place_dict`` and ``validate_actions`` call it for the models they build, call it
+    for other models that are kept in memory - nested models included, they are not interned with their parent. Values
+    are written to the model __dict__, so model_fields_set does not change.
+    """
+    pool = active_pool()
+
+    if pool is not None:
+        _intern_fields(model, pool)
+
+    return model
+
+
+def _intern_fields(model: BaseModel, pool: InternPool) -> None:
+    values = model.__dict__
+
+    for name in getattr(model, "interned_fields", ()):
+        value = values[name]
+
+        if isinstance(value, str):
+            values[name] = pool.intern(value)
+        elif value:
+            value[:] = map(pool.intern, value)
@@ -0,0 +1,25 @@
+from typing import TYPE_CHECKING
+
+from event_models._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from event_models.logger.fluent_formatter import SafeFluentRecordFormatter
+    from event_models.logger.logger import AppLogger, FluentLoggerWriter
+    from event_models.logger.message import LoggerMessage
+
+__all__ = [
+    "AppLogger",
+    "FluentLoggerWriter",
+    "LoggerMessage",
+    "SafeFluentRecordFormatter",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AppLogger": "event_models.logger.logger",
+        "FluentLoggerWriter": "event_models.logger.logger",
+        "LoggerMessage": "event_models.logger.message",
+        "SafeFluentRecordFormatter": "event_models.logger.fluent_formatter",
+    },
+)
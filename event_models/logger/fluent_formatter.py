@@ -0,0 +1,13 @@
+from typing import Any
+
+from fluent.handler import FluentRecordFormatter  # type: ignore[import-untyped]
+
+from event_models.logger.message import LoggerMessage
+
+
+class SafeFluentRecordFormatter(FluentRecordFormatter):  # type: ignore[misc]
+    def format(self, record: Any) -> str:
+        if not hasattr(record, "message_id"):
+            record.message_id = str(LoggerMessage.UNKNOWN)
+
+        return super().format(record)  # type: ignore[no-any-return]
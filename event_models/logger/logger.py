@@ -1,10 +1,20 @@
 import logging
-from typing import Any, override
-
-from fluent.handler import FluentHandler, FluentRecordFormatter  # type: ignore[import-untyped]
+from typing import TYPE_CHECKING, Any, override
 
+from event_models._lazy import lazy_exports
 from event_models.logger.message import LoggerMessage
 
+if TYPE_CHECKING:
+    from event_models.logger.fluent_formatter import SafeFluentRecordFormatter  # noqa: F401
+
+# fluent is imported only once fluent logging is used
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "SafeFluentRecordFormatter": "event_models.logger.fluent_formatter",
+    },
+)
+
 
 class AppLogger(logging.Logger):
     def __init__(self, name: str) -> None:
@@ -14,6 +24,10 @@ class AppLogger(logging.Logger):
 
     @staticmethod
     def init_fluent_logging(tag: str, host: str, port: int, log_format: str, datefmt: str) -> None:
+        from fluent.handler import FluentHandler  # type: ignore[import-untyped]
+
+        from event_models.logger.fluent_formatter import SafeFluentRecordFormatter
+
         fluent_handler = FluentHandler(
             tag=tag,
             host=host,
@@ -198,11 +212,3 @@ class FluentLoggerWriter:
 
     def flush(self) -> None:
         pass
-
-
-class SafeFluentRecordFormatter(FluentRecordFormatter):  # type: ignore[misc]
-    def format(self, record: Any) -> str:
-        if not hasattr(record, "message_id"):
-            record.message_id = str(LoggerMessage.UNKNOWN)
-
-        return super().format(record)  # type: ignore[no-any-return]
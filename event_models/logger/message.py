@@ -10,3 +10,4 @@ class LoggerMessage(StrEnum):
     POSTGRES = "postgres"
     TIME = "time"
     SERVICE = "service"
+    PROFILING = "profiling"
@@ -0,0 +1,73 @@
+from typing import TYPE_CHECKING
+
+from event_models._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from event_models.notification.notification import (
+        ChangeData,
+        DropsData,
+        DropsMessage,
+        FrozenChangeData,
+        FrozenDropsData,
+        FrozenDropsMessage,
+        FrozenPriceChangeMessage,
+        FrozenSeatData,
+        FrozenSeatDataWithPriceChange,
+        MovesData,
+        MovesMessage,
+        NotificationMessage,
+        NotificationMessageFactory,
+        NotificationType,
+        PriceChangeMessage,
+        RemainingSeatsMessage,
+        RemainsData,
+        SeatData,
+        SeatDataWithPriceChange,
+    )
+
+__all__ = [
+    "ChangeData",
+    "DropsData",
+    "DropsMessage",
+    "FrozenChangeData",
+    "FrozenDropsData",
+    "FrozenDropsMessage",
+    "FrozenPriceChangeMessage",
+    "FrozenSeatData",
+    "FrozenSeatDataWithPriceChange",
+    "MovesData",
+    "MovesMessage",
+    "NotificationMessage",
+    "NotificationMessageFactory",
+    "NotificationType",
+    "PriceChangeMessage",
+    "RemainingSeatsMessage",
+    "RemainsData",
+    "SeatData",
+    "SeatDataWithPriceChange",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ChangeData": "event_models.notification.notification",
+        "DropsData": "event_models.notification.notification",
+        "DropsMessage": "event_models.notification.notification",
+        "FrozenChangeData": "event_models.notification.notification",
+        "FrozenDropsData": "event_models.notification.notification",
+        "FrozenDropsMessage": "event_models.notification.notification",
+        "FrozenPriceChangeMessage": "event_models.notification.notification",
+        "FrozenSeatData": "event_models.notification.notification",
+        "FrozenSeatDataWithPriceChange": "event_models.notification.notification",
+        "MovesData": "event_models.notification.notification",
+        "MovesMessage": "event_models.notification.notification",
+        "NotificationMessage": "event_models.notification.notification",
+        "NotificationMessageFactory": "event_models.notification.notification",
+        "NotificationType": "event_models.notification.notification",
+        "PriceChangeMessage": "event_models.notification.notification",
+        "RemainingSeatsMessage": "event_models.notification.notification",
+        "RemainsData": "event_models.notification.notification",
+        "SeatData": "event_models.notification.notification",
+        "SeatDataWithPriceChange": "event_models.notification.notification",
+    },
+)
@@ -1,9 +1,11 @@
 import datetime
 import enum
 from decimal import Decimal
-from typing import Any
+from typing import Any, ClassVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from event_models._cached_json import CachedJsonModel
 
 
 class SeatData(BaseModel):
@@ -12,6 +14,11 @@ class SeatData(BaseModel):
     seat: str
     price: Decimal
 
+    # strings repeated across seats, see intern_model
+    interned_fields: ClassVar[tuple[str, ...]] = ("section", "row")
+
+    model_config = ConfigDict(defer_build=True)
+
 
 class SeatDataWithPriceChange(SeatData):
     old_price: Decimal
@@ -28,18 +35,26 @@ class NotificationType(enum.StrEnum):
 class DropsData(BaseModel):
     seats: list[SeatData]
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ChangeData(BaseModel):
     seats: list[SeatDataWithPriceChange]
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class MovesData(BaseModel):
     seats: list[SeatData]
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class RemainsData(BaseModel):
     remains: int
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class NotificationMessage(BaseModel):
     notification_type: NotificationType
@@ -47,6 +62,8 @@ class NotificationMessage(BaseModel):
     timestamp: datetime.datetime
     data: DropsData | ChangeData | MovesData | RemainsData
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class DropsMessage(NotificationMessage):
     notification_type: NotificationType = NotificationType.DROPS
@@ -58,6 +75,35 @@ class PriceChangeMessage(NotificationMessage):
     data: ChangeData
 
 
+# nested data of the frozen messages, so that the cached JSON bytes cannot go stale
+class FrozenSeatData(SeatData):
+    model_config = ConfigDict(frozen=True)
+
+
+class FrozenSeatDataWithPriceChange(SeatDataWithPriceChange):
+    model_config = ConfigDict(frozen=True)
+
+
+class FrozenDropsData(DropsData):
+    seats: tuple[FrozenSeatData, ...]  # type: ignore[assignment]
+
+    model_config = ConfigDict(frozen=True)
+
+
+class FrozenChangeData(ChangeData):
+    seats: tuple[FrozenSeatDataWithPriceChange, ...]  # type: ignore[assignment]
+
+    model_config = ConfigDict(frozen=True)
+
+
+class FrozenDropsMessage(DropsMessage, CachedJsonModel):
+    data: FrozenDropsData
+
+
+class FrozenPriceChangeMessage(PriceChangeMessage, CachedJsonModel):
+    data: FrozenChangeData
+
+
 class MovesMessage(NotificationMessage):
     notification_type: NotificationType = NotificationType.MOVES
     data: MovesData
@@ -0,0 +1,49 @@
+from typing import TYPE_CHECKING
+
+from event_models._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from event_models.profiling.profiling import (
+        ModelProfile,
+        ProfilingSnapshot,
+        ValidatorProfile,
+        disable_profiling,
+        enable_profiling,
+        is_profiling_enabled,
+        log_profiling,
+        profiled_validator,
+        profiling_session,
+        profiling_snapshot,
+        reset_profiling,
+    )
+
+__all__ = [
+    "ModelProfile",
+    "ProfilingSnapshot",
+    "ValidatorProfile",
+    "disable_profiling",
+    "enable_profiling",
+    "is_profiling_enabled",
+    "log_profiling",
+    "profiled_validator",
+    "profiling_session",
+    "profiling_snapshot",
+    "reset_profiling",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ModelProfile": "event_models.profiling.profiling",
+        "ProfilingSnapshot": "event_models.profiling.profiling",
+        "ValidatorProfile": "event_models.profiling.profiling",
+        "disable_profiling": "event_models.profiling.profiling",
+        "enable_profiling": "event_models.profiling.profiling",
+        "is_profiling_enabled": "event_models.profiling.profiling",
+        "log_profiling": "event_models.profiling.profiling",
+        "profiled_validator": "event_models.profiling.profiling",
+        "profiling_session": "event_models.profiling.profiling",
+        "profiling_snapshot": "event_models.profiling.profiling",
+        "reset_profiling": "event_models.profiling.profiling",
+    },
+)
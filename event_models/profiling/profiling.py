@@ -0,0 +1,309 @@
+import functools
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from types import MethodType
+from typing import Any, ParamSpec, TypeVar
+
+from pydantic import BaseModel, ConfigDict, NonNegativeFloat, NonNegativeInt
+
+from event_models.logger.logger import AppLogger
+from event_models.logger.message import LoggerMessage
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+DEFAULT_MODULE_PREFIX = "event_models."
+_PACKAGE_PREFIX = __name__.split(".")[0] + "."
+
+# model entry points timed while profiling is enabled, by kind of the recorded time
+_VALIDATION_METHODS = ("__init__", "model_validate", "model_validate_json", "model_validate_strings")
+_SERIALIZATION_METHODS = ("model_dump", "model_dump_json")
+
+
+class ModelProfile(BaseModel):
+    name: str
+    # models created through __init__ or model_validate*, nested models are part of their parent's time
+    constructions: NonNegativeInt = 0
+    validation_errors: NonNegativeInt = 0
+    validation_seconds: NonNegativeFloat = 0.0
+    serializations: NonNegativeInt = 0
+    serialization_seconds: NonNegativeFloat = 0.0
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class ValidatorProfile(BaseModel):
+    name: str
+    # a field validator is called once per field it validates, model validators once per validated model
+    calls: NonNegativeInt = 0
+    errors: NonNegativeInt = 0
+    seconds: NonNegativeFloat = 0.0
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class ProfilingSnapshot(BaseModel):
+    enabled: bool
+    # seconds since the last reset
+    duration: NonNegativeFloat
+    models: dict[str, ModelProfile]
+    validators: dict[str, ValidatorProfile]
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class _Profiler:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.module_prefix = DEFAULT_MODULE_PREFIX
+        self.started = time.perf_counter()
+        self.models: dict[str, ModelProfile] = {}
+        self.validators: dict[str, ValidatorProfile] = {}
+        # reentrant, the profile models are created while the lock is held
+        self.lock = threading.RLock()
+        self.originals: dict[str, Any] = {}
+
+    def model(self, cls: type) -> ModelProfile | None:
+        if cls.__module__ == __name__ or not cls.__module__.startswith(self.module_prefix):
+            return None
+
+        name = cls.__qualname__
+
+        if (profile := self.models.get(name)) is None:
+            profile = self.models.setdefault(name, ModelProfile(name=name))
+
+        return profile
+
+
+_profiler = _Profiler()
+# profiled validator functions and their timing wrappers
+_validator_wrappers: dict[Callable[..., Any], Callable[..., Any]] = {}
+
+
+def profiled_validator(func: Callable[P, R]) -> Callable[P, R]:
+    """Record the calls and time of a custom validator while profiling is enabled.
+
+    Apply it below the pydantic validator decorator. The function is returned unchanged - pydantic compiles the
+    validators into the model schemas, so ``enable_profiling`` swaps in the timing wrapper and rebuilds the models using
+    it, and ``disable_profiling`` swaps the function back. A disabled profiler does not add anything to the calls.
+    """
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        started = time.perf_counter()
+        failed = True
+
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+        finally:
+            elapsed = time.perf_counter() - started
+
+            with _profiler.lock:
+                if (profile := _profiler.validators.get(name)) is None:
+                    profile = _profiler.validators.setdefault(name, ValidatorProfile(name=name))
+
+                profile.calls += 1
+                profile.errors += failed
+                profile.seconds += elapsed
+
+        return result
+
+    _validator_wrappers[func] = wrapper
+    return func
+
+
+def _model_classes(cls: type[BaseModel] = BaseModel) -> Iterator[type[BaseModel]]:
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _model_classes(subclass)
+
+
+def _swap_validator(decorator: Any, swaps: dict[Callable[..., Any], Callable[..., Any]]) -> bool:
+    # class validators are bound to the model class
+    if isinstance(func := decorator.func, MethodType):
+        if (replacement := swaps.get(func.__func__)) is None:
+            return False
+
+        decorator.func = MethodType(replacement, func.__self__)
+
+    elif (replacement := swaps.get(func)) is not None:
+        decorator.func = replacement
+
+    return replacement is not None
+
+
+def _swap_validators(model: type[BaseModel], profiled: bool) -> bool:
+    swaps = _validator_wrappers if profiled else {wrapper: func for func, wrapper in _validator_wrappers.items()}
+    decorators = model.__pydantic_decorators__
+    validators = [*decorators.field_validators.values(), *decorators.model_validators.values()]
+
+    return sum(_swap_validator(decorator, swaps) for decorator in validators) > 0
+
+
+def _rebuild_validators(profiled: bool) -> None:
+    # models built before the swap keep the compiled validator functions - the models using a profiled validator and
+    # the built models of this package, which may embed them, are rebuilt. Schemas built elsewhere, like TypeAdapters,
+    # keep the functions they were built with.
+    models = [
+        model
+        for model in _model_classes()
+        if _swap_validators(model, profiled) or model.__module__.startswith(_PACKAGE_PREFIX)
+    ]
+    built = [model for model in models if model.__pydantic_complete__]
+
+    # the parent schemas reuse the schemas of the nested models, so none is reused before it is rebuilt
+    for model in built:
+        if "__pydantic_core_schema__" in model.__dict__:
+            delattr(model, "__pydantic_core_schema__")
+
+    for model in built:
+        model.model_rebuild(force=True)
+
+
+def _timed_validation(method: Callable[..., Any], classmethod_: bool) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(target: Any, *args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        failed = True
+
+        try:
+            result = method(target, *args, **kwargs)
+            failed = False
+        finally:
+            elapsed = time.perf_counter() - started
+
+            with _profiler.lock:
+                if (profile := _profiler.model(target if classmethod_ else type(target))) is not None:
+                    profile.constructions += not failed
+                    profile.validation_errors += failed
+                    profile.validation_seconds += elapsed
+
+        return result
+
+    return wrapper
+
+
+def _timed_serialization(method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(model: BaseModel, *args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+
+        try:
+            return method(model, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+
+            with _profiler.lock:
+                if (profile := _profiler.model(type(model))) is not None:
+                    profile.serializations += 1
+                    profile.serialization_seconds += elapsed
+
+    return wrapper
+
+
+def enable_profiling(module_prefix: str = DEFAULT_MODULE_PREFIX) -> None:
+    """Start recording model and validator costs.
+
+    The pydantic BaseModel entry points are wrapped while profiling is enabled, so models of other packages pay the
+    timing overhead as well - only models defined in modules starting with ``module_prefix`` are recorded. The models
+    using a ``profiled_validator`` are rebuilt, on enabling and on disabling.
+    """
+    with _profiler.lock:
+        _profiler.module_prefix = module_prefix
+
+        if _profiler.enabled:
+            return
+
+        for name in _VALIDATION_METHODS:
+            original = BaseModel.__dict__[name]
+            _profiler.originals[name] = original
+
+            if isinstance(original, classmethod):
+                setattr(BaseModel, name, classmethod(_timed_validation(original.__func__, classmethod_=True)))
+            else:
+                wrapper = _timed_validation(original, classmethod_=False)
+                # models created while profiling is enabled must not be treated as having a custom __init__
+                wrapper.__pydantic_base_init__ = True  # type: ignore[attr-defined]
+                setattr(BaseModel, name, wrapper)
+
+        for name in _SERIALIZATION_METHODS:
+            _profiler.originals[name] = BaseModel.__dict__[name]
+            setattr(BaseModel, name, _timed_serialization(_profiler.originals[name]))
+
+        _rebuild_validators(profiled=True)
+        _profiler.enabled = True
+
+
+def disable_profiling() -> None:
+    """Stop recording, the recorded data is kept until ``reset_profiling``."""
+    with _profiler.lock:
+        if not _profiler.enabled:
+            return
+
+        for name, original in _profiler.originals.items():
+            setattr(BaseModel, name, original)
+
+        _profiler.originals.clear()
+        _rebuild_validators(profiled=False)
+        _profiler.enabled = False
+
+
+def is_profiling_enabled() -> bool:
+    return _profiler.enabled
+
+
+@contextmanager
+def profiling_session(module_prefix: str = DEFAULT_MODULE_PREFIX) -> Iterator[None]:
+    enable_profiling(module_prefix)
+
+    try:
+        yield
+    finally:
+        disable_profiling()
+
+
+def profiling_snapshot() -> ProfilingSnapshot:
+    with _profiler.lock:
+        return ProfilingSnapshot(
+            enabled=_profiler.enabled,
+            duration=time.perf_counter() - _profiler.started,
+            models={name: profile.model_copy() for name, profile in _profiler.models.items()},
+            validators={name: profile.model_copy() for name, profile in _profiler.validators.items()},
+        )
+
+
+def reset_profiling() -> None:
+    with _profiler.lock:
+        _profiler.models.clear()
+        _profiler.validators.clear()
+        _profiler.started = time.perf_counter()
+
+
+def log_profiling(logger: AppLogger | None = None, reset: bool = False) -> None:
+    """Log the recorded costs, one record per model and validator with the numbers in the record extra."""
+    logger = logger or AppLogger(__name__)
+    snapshot = profiling_snapshot()
+
+    if reset:
+        reset_profiling()
+
+    for model in sorted(snapshot.models.values(), key=lambda profile: -profile.validation_seconds):
+        logger.info(
+            f"Model {model.name}: {model.constructions} constructions, {model.validation_errors} failed, "
+            f"in {model.validation_seconds:.6f}s, "
+            f"{model.serializations} serializations in {model.serialization_seconds:.6f}s",
+            extra={"profiling": model.model_dump(), "duration": snapshot.duration},
+            message_id=LoggerMessage.PROFILING,
+        )
+
+    for validator in sorted(snapshot.validators.values(), key=lambda profile: -profile.seconds):
+        logger.info(
+            f"Validator {validator.name}: {validator.calls} calls, {validator.errors} failed, "
+            f"in {validator.seconds:.6f}s",
+            extra={"profiling": validator.model_dump(), "duration": snapshot.duration},
+            message_id=LoggerMessage.PROFILING,
+        )
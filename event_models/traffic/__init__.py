@@ -0,0 +1,57 @@
+from typing import TYPE_CHECKING
+
+from event_models._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from event_models.traffic.replay import (
+        CallbackSink,
+        QueueSink,
+        ReplayReport,
+        TrafficSink,
+        decode_record,
+        replay,
+    )
+    from event_models.traffic.traffic import (
+        TrafficConfig,
+        TrafficFormat,
+        TrafficGenerator,
+        TrafficKind,
+        TrafficRecord,
+        read_traffic,
+        write_traffic,
+    )
+
+__all__ = [
+    "CallbackSink",
+    "QueueSink",
+    "ReplayReport",
+    "TrafficConfig",
+    "TrafficFormat",
+    "TrafficGenerator",
+    "TrafficKind",
+    "TrafficRecord",
+    "TrafficSink",
+    "decode_record",
+    "read_traffic",
+    "replay",
+    "write_traffic",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "CallbackSink": "event_models.traffic.replay",
+        "QueueSink": "event_models.traffic.replay",
+        "ReplayReport": "event_models.traffic.replay",
+        "TrafficSink": "event_models.traffic.replay",
+        "decode_record": "event_models.traffic.replay",
+        "replay": "event_models.traffic.replay",
+        "TrafficConfig": "event_models.traffic.traffic",
+        "TrafficFormat": "event_models.traffic.traffic",
+        "TrafficGenerator": "event_models.traffic.traffic",
+        "TrafficKind": "event_models.traffic.traffic",
+        "TrafficRecord": "event_models.traffic.traffic",
+        "read_traffic": "event_models.traffic.traffic",
+        "write_traffic": "event_models.traffic.traffic",
+    },
+)
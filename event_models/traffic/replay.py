@@ -0,0 +1,135 @@
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any, Protocol
+
+from pydantic import BaseModel, ConfigDict, NonNegativeFloat, NonNegativeInt
+
+from event_models._stats import percentile
+from event_models.available.ticketmaster import TicketmasterEventAvailable
+from event_models.event.event import EventMessage
+from event_models.notification.notification import NotificationMessageFactory, NotificationType
+from event_models.traffic.traffic import TrafficKind, TrafficRecord
+from event_models.trigger.model.model import JobRunMessage, JobScrapMessage
+
+
+class TrafficSink(Protocol):
+    async def send(self, record: TrafficRecord) -> None: ...
+
+
+class QueueSink:
+    """In-memory stand-in broker, consumers read the records from ``queue``.
+
+    A bounded queue applies back-pressure: the replay waits while consumers are behind and the waiting shows up in
+    the send latency.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.queue: asyncio.Queue[TrafficRecord] = asyncio.Queue(maxsize)
+
+    async def send(self, record: TrafficRecord) -> None:
+        await self.queue.put(record)
+
+
+class CallbackSink:
+    """Sink calling a function per record, e.g. ``decode_record`` to measure the consumer side model cost."""
+
+    def __init__(self, callback: Callable[[TrafficRecord], Any]) -> None:
+        self.callback = callback
+
+    async def send(self, record: TrafficRecord) -> None:
+        result = self.callback(record)
+
+        if isinstance(result, Awaitable):
+            await result
+
+
+def decode_record(record: TrafficRecord) -> BaseModel:
+    """Decode the record into the model its consumer would build."""
+    match record.kind:
+        case TrafficKind.JOB_RUN:
+            return JobRunMessage.model_validate_json(record.data)
+        case TrafficKind.JOB_SCRAP:
+            return JobScrapMessage.model_validate_json(record.data)
+        case TrafficKind.EVENT_MESSAGE:
+            return EventMessage.model_validate_json(record.data)
+        case TrafficKind.AVAILABILITY:
+            return TicketmasterEventAvailable.from_place_dict(record.key, json.loads(record.data))
+        case TrafficKind.NOTIFICATION:
+            data = json.loads(record.data)
+            return NotificationMessageFactory.get_message_from_notify_type(
+                NotificationType(data["notification_type"]), data
+            )
+
+
+class ReplayReport(BaseModel):
+    sent: NonNegativeInt
+    # records per kind
+    kinds: dict[TrafficKind, NonNegativeInt]
+    bytes: NonNegativeInt
+    elapsed: NonNegativeFloat
+    throughput: NonNegativeFloat
+    target_rate: NonNegativeFloat | None
+    # seconds from the scheduled send time until the sink accepted the record, includes falling behind schedule
+    latency_mean: NonNegativeFloat | None
+    latency_p50: NonNegativeFloat | None
+    latency_p99: NonNegativeFloat | None
+    latency_max: NonNegativeFloat | None
+
+    model_config = ConfigDict(defer_build=True)
+
+
+async def _paced(records: Iterable[TrafficRecord], rate: float | None) -> AsyncIterator[tuple[TrafficRecord, float]]:
+    started = time.perf_counter()
+
+    for index, record in enumerate(records):
+        if rate is None:
+            yield record, time.perf_counter()
+            continue
+
+        scheduled = started + index / rate
+
+        # records that are due are sent without yielding to the loop, a sleep per record would cap the rate
+        if (delay := scheduled - time.perf_counter()) > 0:
+            await asyncio.sleep(delay)
+
+        yield record, scheduled
+
+
+async def replay(records: Iterable[TrafficRecord], sink: TrafficSink, rate: float | None = None) -> ReplayReport:
+    """Send the records to the sink at the target rate in records per second, as fast as possible without one.
+
+    Latencies are measured from the scheduled send time, so a sink that cannot keep up with the rate shows a growing
+    latency rather than a silently lower rate.
+    """
+    if rate is not None and rate <= 0:
+        raise ValueError(f"Replay rate must be positive: {rate}")
+
+    latencies: list[float] = []
+    kinds: dict[TrafficKind, int] = {}
+    size = 0
+    started = time.perf_counter()
+
+    async for record, scheduled in _paced(records, rate):
+        await sink.send(record)
+        latencies.append(time.perf_counter() - scheduled)
+        kinds[record.kind] = kinds.get(record.kind, 0) + 1
+        size += len(record.data)
+
+    elapsed = time.perf_counter() - started
+    latency_total = sum(latencies)
+    latencies.sort()
+
+    return ReplayReport(
+        sent=len(latencies),
+        kinds=kinds,
+        bytes=size,
+        elapsed=elapsed,
+        throughput=len(latencies) / elapsed if elapsed else 0.0,
+        target_rate=rate,
+        latency_mean=latency_total / len(latencies) if latencies else None,
+        latency_p50=percentile(latencies, 0.5),
+        latency_p99=percentile(latencies, 0.99),
+        latency_max=latencies[-1] if latencies else None,
+    )
@@ -0,0 +1,481 @@
+import bisect
+import datetime
+import enum
+import itertools
+import json
+import math
+import os
+import random
+import struct
+import uuid
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any, BinaryIO, Generic, NamedTuple, Self, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field, NonNegativeFloat, PositiveFloat, PositiveInt, model_validator
+
+from event_models.event.event import EventAction, EventSource
+from event_models.notification.notification import NotificationType
+from event_models.trigger.enum import FailureReason, ScrapType
+
+K = TypeVar("K")
+
+
+class TrafficKind(enum.StrEnum):
+    JOB_RUN = "job-run"
+    JOB_SCRAP = "job-scrap"
+    EVENT_MESSAGE = "event-message"
+    # redis availability hash of an event, as decoded by TicketmasterEventAvailable.from_place_dict
+    AVAILABILITY = "availability"
+    NOTIFICATION = "notification"
+
+
+class TrafficFormat(enum.StrEnum):
+    NDJSON = "ndjson"
+    BINARY = "binary"
+
+
+class TrafficRecord(NamedTuple):
+    kind: TrafficKind
+    # event identifier, the partitioning key of the record
+    key: str
+    # compact JSON message as published
+    data: bytes
+
+
+class TrafficConfig(BaseModel):
+    """Distributions of the generated traffic, weights do not have to sum up to one."""
+
+    seed: int = 0
+    start: datetime.datetime = datetime.datetime(2024, 6, 1, 10, tzinfo=datetime.timezone.utc)
+    # messages per second of the message timestamps, not of the replay
+    nominal_rate: PositiveFloat = 1000.0
+    # weights per generated message, a notification burst is one draw of several records
+    kinds: dict[TrafficKind, NonNegativeFloat] = {
+        TrafficKind.JOB_RUN: 0.25,
+        TrafficKind.JOB_SCRAP: 0.25,
+        TrafficKind.EVENT_MESSAGE: 0.35,
+        TrafficKind.AVAILABILITY: 0.05,
+        TrafficKind.NOTIFICATION: 0.1,
+    }
+
+    events: PositiveInt = 1000
+    # Zipf exponent of the event popularity, on-sales concentrate the traffic on a few events
+    event_skew: NonNegativeFloat = 1.1
+
+    scrap_types: dict[ScrapType, NonNegativeFloat] = {
+        ScrapType.TICKETMASTER_MAP: 0.45,
+        ScrapType.TICKETMASTER_FACET: 0.15,
+        ScrapType.VIVIDSEATS: 0.1,
+        ScrapType.STUBHUB: 0.1,
+        ScrapType.SEATGEEK: 0.08,
+        ScrapType.EVENUE_SEAT: 0.04,
+        ScrapType.AXS: 0.04,
+        ScrapType.TICKPICK: 0.04,
+    }
+    urgent_rate: float = Field(default=0.05, ge=0, le=1)
+    retry_rate: float = Field(default=0.1, ge=0, le=1)
+    scrap_success_rate: float = Field(default=0.85, ge=0, le=1)
+    failure_reasons: dict[FailureReason, NonNegativeFloat] = {
+        FailureReason.ACCESS_DENIED: 0.25,
+        FailureReason.PROXY_ERROR: 0.2,
+        FailureReason.TIMEOUT: 0.15,
+        FailureReason.NOT_FOUND: 0.1,
+        FailureReason.NOT_ON_SALE: 0.1,
+        FailureReason.SCRAP_SERVICE_OVERLOAD: 0.08,
+        FailureReason.SOLD_OUT: 0.05,
+        FailureReason.DATA_ISSUE: 0.04,
+        FailureReason.NO_SECTIONS: 0.03,
+    }
+
+    event_sources: dict[EventSource, NonNegativeFloat] = {
+        EventSource.TICKETMASTER_MAP: 0.5,
+        EventSource.TICKETMASTER_FACET: 0.1,
+        EventSource.VIVIDSEATS: 0.1,
+        EventSource.STUBHUB: 0.1,
+        EventSource.SEATGEEK: 0.1,
+        EventSource.EVENUE_SEAT: 0.05,
+        EventSource.AXS: 0.05,
+    }
+    event_actions: dict[EventAction, NonNegativeFloat] = {
+        EventAction.STORE: 0.8,
+        EventAction.NOTIFY: 0.1,
+        EventAction.FULL_UPDATE: 0.07,
+        EventAction.ARCHIVE: 0.03,
+    }
+    not_found_rate: float = Field(default=0.02, ge=0, le=1)
+    not_on_sale_rate: float = Field(default=0.03, ge=0, le=1)
+
+    old_schema_rate: float = Field(default=0.2, ge=0, le=1)
+    # number of available places per availability hash is log-normal
+    places_median: PositiveInt = 1500
+    places_sigma: NonNegativeFloat = 0.8
+    max_places: PositiveInt = 20_000
+    sections: PositiveInt = 40
+    rows: PositiveInt = 25
+    seats_per_row: PositiveInt = 20
+    # section prices are log-normal, seat prices vary around their section price
+    price_median: PositiveFloat = 120.0
+    price_sigma: NonNegativeFloat = 0.6
+    fee_rate: NonNegativeFloat = 0.18
+
+    notification_types: dict[NotificationType, NonNegativeFloat] = {
+        NotificationType.DROPS: 0.5,
+        NotificationType.PRICE_CHANGE: 0.3,
+        NotificationType.MOVES: 0.1,
+        NotificationType.REMAINING_SEATS: 0.1,
+    }
+    # notifications of one event come in bursts, burst and seat list sizes are geometric with these means
+    notification_burst: PositiveFloat = 5.0
+    notification_seats: PositiveFloat = 4.0
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
+    @model_validator(mode="after")
+    def check_weights(self) -> Self:  # noqa: N804 - after validators are instance methods
+        for name in ("kinds", "scrap_types", "failure_reasons", "event_sources", "event_actions", "notification_types"):
+            if not any(getattr(self, name).values()):
+                raise ValueError(f"{name} must have at least one positive weight")
+
+        return self
+
+
+_OFFER_NAMES = ("Standard Admission", "Official Platinum", "Verified Resale")
+
+
+class _Venue(NamedTuple):
+    # per section: name, price and number of rows
+    sections: list[tuple[str, float, int]]
+    # cumulative number of seats up to and including each section
+    seat_offsets: list[int]
+
+
+class _Choice(Generic[K]):
+    def __init__(self, weights: Mapping[K, float]) -> None:
+        self.values = list(weights)
+        self.cumulative = list(itertools.accumulate(weights.values()))
+
+    def __call__(self, rng: random.Random) -> K:
+        return rng.choices(self.values, cum_weights=self.cumulative)[0]
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+class TrafficGenerator:
+    """Seeded generator of production-shaped message streams.
+
+    The same config always generates the same records, availability of an event keeps its venue layout and prices
+    across records.
+    """
+
+    def __init__(self, config: TrafficConfig | None = None) -> None:
+        self.config = config or TrafficConfig()
+
+        config = self.config
+        self._rng = random.Random(config.seed)  # noqa: S311 - reproducible synthetic data
+        self._sequence = 0
+        event_ids = [f"{config.seed:x}-event-{event:05d}" for event in range(config.events)]
+        self._venue_ids = {event_id: f"venue-{event % 97:02d}" for event, event_id in enumerate(event_ids)}
+        self._events = _Choice({event_id: 1 / rank**config.event_skew for rank, event_id in enumerate(event_ids, 1)})
+        self._kinds = _Choice(config.kinds)
+        self._scrap_types = _Choice(config.scrap_types)
+        self._failure_reasons = _Choice(config.failure_reasons)
+        self._event_sources = _Choice(config.event_sources)
+        self._event_actions = _Choice(config.event_actions)
+        self._notification_types = _Choice(config.notification_types)
+        self._venues: dict[str, _Venue] = {}
+
+    def records(self, count: int) -> Iterator[TrafficRecord]:
+        """Generate ``count`` records in the configured kind mix, notification bursts count one record each."""
+        generated = 0
+
+        while generated < count:
+            for record in self.generate(self._kinds(self._rng)):
+                if generated == count:
+                    return
+
+                yield record
+                generated += 1
+
+    def generate(self, kind: TrafficKind) -> list[TrafficRecord]:
+        match kind:
+            case TrafficKind.JOB_RUN:
+                return [self.job_run()]
+            case TrafficKind.JOB_SCRAP:
+                return [self.job_scrap()]
+            case TrafficKind.EVENT_MESSAGE:
+                return [self.event_message()]
+            case TrafficKind.AVAILABILITY:
+                return [self.availability()]
+            case TrafficKind.NOTIFICATION:
+                return self.notification_burst()
+
+    def job_run(self) -> TrafficRecord:
+        rng = self._rng
+        event_id = self._events(rng)
+        retry = 0
+
+        while rng.random() < self.config.retry_rate and retry < 5:
+            retry += 1
+
+        message = {
+            "job_run_id": str(self._uuid()),
+            "event_id": event_id,
+            "scrap_type": self._scrap_types(rng),
+            "run_config": None,
+            "retry": retry,
+            "urgent": rng.random() < self.config.urgent_rate,
+        }
+
+        return self._record(TrafficKind.JOB_RUN, event_id, message)
+
+    def job_scrap(self) -> TrafficRecord:
+        rng = self._rng
+        event_id = self._events(rng)
+        started = self._timestamp()
+        success = rng.random() < self.config.scrap_success_rate
+
+        message = {
+            "event_id": event_id,
+            "job_id": str(self._uuid()),
+            "scrap_type": self._scrap_types(rng),
+            "job_scrap_started_at": started.isoformat(),
+            "job_scrap_finished_at": (started + datetime.timedelta(seconds=rng.lognormvariate(1.5, 0.7))).isoformat(),
+            "scrap_success": success,
+            "failure_reason": None if success else self._failure_reasons(rng),
+            "scrap_notes": None,
+        }
+
+        return self._record(TrafficKind.JOB_SCRAP, event_id, message)
+
+    def event_message(self) -> TrafficRecord:
+        rng = self._rng
+        event_id = self._events(rng)
+
+        header = {
+            "event-message-id": str(self._uuid()),
+            "event-source": self._event_sources(rng),
+            "venue-id": self._venue_ids[event_id],
+            "event-id": event_id,
+            "event-action": self._event_actions(rng),
+            "event-timestamp": self._timestamp().isoformat(),
+            "no-map": rng.random() < 0.01,
+            "not-found": rng.random() < self.config.not_found_rate,
+            "not-on-sale": rng.random() < self.config.not_on_sale_rate,
+        }
+
+        return self._record(TrafficKind.EVENT_MESSAGE, event_id, {"header": header})
+
+    def availability(self) -> TrafficRecord:
+        """Redis availability hash of an event, old or new schema."""
+        config = self.config
+        rng = self._rng
+        event_id = self._events(rng)
+        venue = self._venue(event_id)
+        old_schema = rng.random() < config.old_schema_rate
+        places = min(
+            config.max_places, max(1, round(rng.lognormvariate(math.log(config.places_median), config.places_sigma)))
+        )
+        inserted = self._timestamp().isoformat()
+        seats = self._seats(venue, places)
+
+        place_dict: dict[str, list[Any]] = {}
+
+        for section, row, seat, section_price in seats:
+            list_price = round(section_price * rng.uniform(0.9, 1.1), 2)
+            total_price = round(list_price * (1 + config.fee_rate), 2)
+            offer = rng.randrange(len(_OFFER_NAMES))
+            offer_name = _OFFER_NAMES[offer]
+            values: list[Any] = [
+                f"{list_price:.2f}",
+                f"{total_price:.2f}",
+                f"offer-{offer}",
+                offer_name,
+                [1, 2, 3, 4] if rng.random() < 0.8 else [2, 4],
+                rng.random() < 0.02,
+                "resale" if offer_name == "Verified Resale" else "primary",
+            ]
+
+            if not old_schema:
+                values += [
+                    None,
+                    f"Level {section}",
+                    section,
+                    f"Row {row}",
+                    row,
+                    seat,
+                    str(seat),
+                    rng.sample(("aisle", "obstructed", "accessible", "standard"), 2),
+                    ["Standard Ticket", "Mobile Entry"],
+                    inserted,
+                    None,
+                    None,
+                ]
+
+            place_dict[f"{event_id}-{section}-{row}-{seat}"] = values
+
+        return self._record(TrafficKind.AVAILABILITY, event_id, place_dict)
+
+    def notification_burst(self) -> list[TrafficRecord]:
+        """Notifications of one event in quick succession, like the notifier sends them during an on-sale."""
+        rng = self._rng
+        event_id = self._events(rng)
+        venue = self._venue(event_id)
+        size = self._geometric(self.config.notification_burst)
+        records = []
+
+        for _ in range(size):
+            notification_type = self._notification_types(rng)
+            data: dict[str, Any]
+
+            if notification_type is NotificationType.REMAINING_SEATS:
+                data = {"remains": rng.randint(0, 5000)}
+            else:
+                data = {"seats": []}
+
+                for section, row, seat, price in self._seats(venue, self._geometric(self.config.notification_seats)):
+                    seat_data = {"section": section, "row": str(row), "seat": str(seat), "price": f"{price:.2f}"}
+
+                    if notification_type is NotificationType.PRICE_CHANGE:
+                        old_price = round(price * rng.uniform(0.8, 1.25), 2)
+                        seat_data |= {"old_price": f"{old_price:.2f}", "price_change": f"{price - old_price:.2f}"}
+
+                    data["seats"].append(seat_data)
+
+            message = {
+                "notification_type": notification_type,
+                "event_id": event_id,
+                "timestamp": self._timestamp().isoformat(),
+                "data": data,
+            }
+            records.append(self._record(TrafficKind.NOTIFICATION, event_id, message))
+
+        return records
+
+    def _record(self, kind: TrafficKind, key: str, message: Any) -> TrafficRecord:
+        self._sequence += 1
+        return TrafficRecord(kind, key, _dumps(message))
+
+    def _timestamp(self) -> datetime.datetime:
+        return self.config.start + datetime.timedelta(seconds=self._sequence / self.config.nominal_rate)
+
+    def _uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self._rng.getrandbits(128), version=4)
+
+    def _geometric(self, mean: float) -> int:
+        # number of trials until the first success, at least one
+        return max(1, math.ceil(math.log(1 - self._rng.random()) / math.log(1 - 1 / mean))) if mean > 1 else 1
+
+    def _venue(self, event_id: str) -> _Venue:
+        if (venue := self._venues.get(event_id)) is None:
+            config = self.config
+            # seeded by the event, the layout does not depend on the order of the generated records
+            rng = random.Random(f"{config.seed}-{event_id}")  # noqa: S311
+            sections = [
+                (
+                    str(100 + section),
+                    rng.lognormvariate(math.log(config.price_median), config.price_sigma),
+                    rng.randint(max(1, config.rows // 2), config.rows),
+                )
+                for section in range(config.sections)
+            ]
+            seat_offsets = list(itertools.accumulate(rows * config.seats_per_row for _, _, rows in sections))
+            venue = self._venues[event_id] = _Venue(sections, seat_offsets)
+
+        return venue
+
+    def _seats(self, venue: _Venue, count: int) -> list[tuple[str, int, int, float]]:
+        """Sample distinct seats of the venue as (section, row, seat, section price)."""
+        seats_per_row = self.config.seats_per_row
+        capacity = venue.seat_offsets[-1]
+        seats = []
+
+        for index in self._rng.sample(range(capacity), min(count, capacity)):
+            section_index = bisect.bisect_right(venue.seat_offsets, index)
+            section, price, _ = venue.sections[section_index]
+            section_seat = index - (venue.seat_offsets[section_index - 1] if section_index else 0)
+            row, seat = divmod(section_seat, seats_per_row)
+            seats.append((section, row + 1, seat + 1, price))
+
+        return seats
+
+
+# binary files: magic and version, then per record the kind code, key and data lengths, key and data
+_MAGIC = b"EVTR"
+_VERSION = 1
+_FILE_HEADER = struct.Struct("<4sH")
+_RECORD_HEADER = struct.Struct("<BHI")
+_KINDS = list(TrafficKind)
+
+
+def _format(path: Path, traffic_format: TrafficFormat | None) -> TrafficFormat:
+    if traffic_format is not None:
+        return traffic_format
+
+    return TrafficFormat.NDJSON if path.suffix in (".ndjson", ".jsonl") else TrafficFormat.BINARY
+
+
+def _read(traffic_file: BinaryIO, size: int, path: Path) -> bytes:
+    data = traffic_file.read(size)
+
+    if len(data) != size:
+        raise ValueError(f"Truncated traffic file {path}: expected {size} bytes, read {len(data)}")
+
+    return data
+
+
+def write_traffic(
+    records: Iterable[TrafficRecord],
+    path: str | os.PathLike[str],
+    traffic_format: TrafficFormat | None = None,
+) -> int:
+    """Write the records to a file, NDJSON for .ndjson and .jsonl files and binary otherwise. Returns the count."""
+    path = Path(path)
+    written = 0
+
+    with path.open("wb") as traffic_file:
+        if _format(path, traffic_format) is TrafficFormat.NDJSON:
+            for record in records:
+                prefix = _dumps({"kind": record.kind, "key": record.key})[:-1]
+                traffic_file.write(prefix + b',"data":' + record.data + b"}\n")
+                written += 1
+        else:
+            traffic_file.write(_FILE_HEADER.pack(_MAGIC, _VERSION))
+
+            for record in records:
+                key = record.key.encode()
+                traffic_file.write(_RECORD_HEADER.pack(_KINDS.index(record.kind), len(key), len(record.data)))
+                traffic_file.write(key)
+                traffic_file.write(record.data)
+                written += 1
+
+    return written
+
+
+def read_traffic(path: str | os.PathLike[str], traffic_format: TrafficFormat | None = None) -> Iterator[TrafficRecord]:
+    """Read the records written by ``write_traffic``, a truncated binary file raises ValueError."""
+    path = Path(path)
+
+    with path.open("rb") as traffic_file:
+        if _format(path, traffic_format) is TrafficFormat.NDJSON:
+            for line in traffic_file:
+                if line.strip():
+                    value = json.loads(line)
+                    yield TrafficRecord(TrafficKind(value["kind"]), value["key"], _dumps(value["data"]))
+
+            return
+
+        magic, version = _FILE_HEADER.unpack(_read(traffic_file, _FILE_HEADER.size, path))
+
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Not a traffic file of version {_VERSION}: {magic!r} {version}")
+
+        while header := traffic_file.read(_RECORD_HEADER.size):
+            if len(header) != _RECORD_HEADER.size:
+                raise ValueError(f"Truncated traffic file {path}: incomplete record header")
+
+            kind, key_size, data_size = _RECORD_HEADER.unpack(header)
+            key = _read(traffic_file, key_size, path).decode()
+            yield TrafficRecord(_KINDS[kind], key, _read(traffic_file, data_size, path))
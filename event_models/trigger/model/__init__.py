@@ -1,3 +1,19 @@
-from event_models.trigger.model.model import JobRunMessage, JobScrapMessage
+from typing import TYPE_CHECKING
 
-__all__ = ["JobRunMessage", "JobScrapMessage"]
+from event_models._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from event_models.trigger.model.model import JobRunMessage, JobScrapMessage
+
+__all__ = [
+    "JobRunMessage",
+    "JobScrapMessage",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "JobRunMessage": "event_models.trigger.model.model",
+        "JobScrapMessage": "event_models.trigger.model.model",
+    },
+)
@@ -1,8 +1,9 @@
 import datetime
 from typing import Any, Optional
 
-from pydantic import UUID4, BaseModel, Field, NonNegativeInt, model_validator
+from pydantic import UUID4, BaseModel, ConfigDict, Field, NonNegativeInt, model_validator
 
+from event_models.profiling.profiling import profiled_validator
 from event_models.trigger.enum import FailureReason, ScrapType
 
 
@@ -14,6 +15,8 @@ class JobRunMessage(BaseModel):
     retry: NonNegativeInt = Field(default=0)
     urgent: bool = False
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class JobScrapMessage(BaseModel):
     event_id: str
@@ -25,7 +28,10 @@ class JobScrapMessage(BaseModel):
     failure_reason: Optional[FailureReason] | None = None
     scrap_notes: Optional[dict[str, Any]] | None = None
 
+    model_config = ConfigDict(defer_build=True)
+
     @model_validator(mode="before")
+    @profiled_validator
     def check_failure_reason(cls: Any, values: Any) -> Any:
         if values["scrap_success"] is False and values.get("failure_reason") is None:
             raise ValueError("failure_reason must be provided if the job failed.")
@@ -38,3 +44,5 @@ class JobArbResultMessage(BaseModel):
     arb_job_finished_at: datetime.datetime | None = None
     arb_success: Optional[bool] = None
     arb_notes: Optional[dict[str, Any]] | None = None
+
+    model_config = ConfigDict(defer_build=True)
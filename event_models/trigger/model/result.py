@@ -1,9 +1,10 @@
 import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, ConfigDict, model_validator
 
 from event_models.event.event import MessageHeader
+from event_models.profiling.profiling import profiled_validator
 from event_models.trigger.enum import FailureReason, ScrapType
 
 
@@ -17,7 +18,10 @@ class EventResultHeader(BaseModel):
     data_process_notes: Optional[dict[str, Any]] | None = None
     error_reason: FailureReason | None = None
 
+    model_config = ConfigDict(defer_build=True)
+
     @model_validator(mode="before")
+    @profiled_validator
     def check_failure(cls: Any, values: Any) -> Any:
         if values["data_process_success"] is False and values.get("error_reason") is None:
             raise ValueError("error must be provided if the event result has a failed status.")
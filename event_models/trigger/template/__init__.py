@@ -1 +1,19 @@
-__all__ = ["get_error_job_message", "get_success_job_message"]
+from typing import TYPE_CHECKING
+
+from event_models._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from event_models.trigger.template.template import get_error_job_message, get_success_job_message
+
+__all__ = [
+    "get_error_job_message",
+    "get_success_job_message",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "get_error_job_message": "event_models.trigger.template.template",
+        "get_success_job_message": "event_models.trigger.template.template",
+    },
+)
@@ -0,0 +1,46 @@
+from typing import TYPE_CHECKING
+
+from event_models._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from event_models.view.view import (
+        ActionDataView,
+        MessageHeaderView,
+        ModelView,
+        SeatDataView,
+        TicketmasterPlaceAvailableView,
+        from_view,
+        from_views,
+        to_view,
+        to_views,
+        view_class,
+    )
+
+__all__ = [
+    "ActionDataView",
+    "MessageHeaderView",
+    "ModelView",
+    "SeatDataView",
+    "TicketmasterPlaceAvailableView",
+    "from_view",
+    "from_views",
+    "to_view",
+    "to_views",
+    "view_class",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ActionDataView": "event_models.view.view",
+        "MessageHeaderView": "event_models.view.view",
+        "ModelView": "event_models.view.view",
+        "SeatDataView": "event_models.view.view",
+        "TicketmasterPlaceAvailableView": "event_models.view.view",
+        "from_view": "event_models.view.view",
+        "from_views": "event_models.view.view",
+        "to_view": "event_models.view.view",
+        "to_views": "event_models.view.view",
+        "view_class": "event_models.view.view",
+    },
+)
@@ -0,0 +1,187 @@
+import copy
+import datetime
+from collections import namedtuple
+from collections.abc import Iterable
+from decimal import Decimal
+from functools import cache
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Optional, Protocol, Self, TypeVar
+
+from pydantic import BaseModel
+
+from event_models.action.action import ActionData, PriceMarkup, SplitType
+from event_models.available.ticketmaster import TicketmasterPlaceAvailable
+from event_models.event.event import EventAction, EventSource, MessageHeader
+from event_models.notification.notification import SeatData
+
+M = TypeVar("M", bound=BaseModel)
+
+# copied when a model is built from a view, so that the model does not share mutable values with it
+_CONTAINERS = (list, dict, set)
+# views of a model have few distinct field sets, equal ones share the same frozenset
+_FIELDS_SETS: dict[frozenset[str], frozenset[str]] = {}
+
+
+class ModelView(Generic[M]):
+    """Read-only, tuple-backed view of a model with the same attribute names.
+
+    Views hold the field values of the model and its ``model_fields_set``, without any other pydantic state, and are
+    not validated. Field values are shared with the model the view was created from, mutable ones must not be modified.
+
+    Views save memory, not access time - a field is read through a tuple item descriptor, a little slower than the
+    instance dict lookup of a model attribute. The fields of the views created by ``view_class`` are typed as Any, the
+    view classes defined in this module declare the field types for type checkers.
+    """
+
+    __slots__ = ()
+
+    model: ClassVar[type[BaseModel]]
+
+    if TYPE_CHECKING:
+        _fields: ClassVar[tuple[str, ...]]
+        model_fields_set: frozenset[str]
+
+        # the field attributes are generated, see view_class
+        def __getattr__(self, name: str) -> Any: ...
+
+        def _asdict(self) -> dict[str, Any]: ...
+
+        @classmethod
+        def _make(cls, iterable: Iterable[Any]) -> Self: ...
+
+    @classmethod
+    def from_model(cls, model: M) -> Self:
+        values = model.__dict__
+        fields_set = frozenset(model.model_fields_set)
+
+        return cls._make(
+            [*(values[name] for name in cls.model.model_fields), _FIELDS_SETS.setdefault(fields_set, fields_set)]
+        )
+
+    def to_model(self, validate: bool = False) -> M:
+        """Create the model from the view values.
+
+        Args:
+            validate: Validate the values again, otherwise the model is constructed without validation.
+        """
+        values = self._asdict()
+        fields_set = values.pop("model_fields_set")
+
+        if validate:
+            # unset fields get their defaults again, like in the original model
+            return self.model.model_validate(  # type: ignore[return-value]
+                {name: value for name, value in values.items() if name in fields_set}
+            )
+
+        for name, value in values.items():
+            if isinstance(value, _CONTAINERS):
+                values[name] = copy.copy(value)
+
+        return self.model.model_construct(_fields_set=set(fields_set), **values)  # type: ignore[return-value]
+
+
+@cache
+def view_class(model: type[M]) -> type[ModelView[M]]:
+    """Generate the view class of a model, the class is created once per model."""
+    name = f"{model.__name__}View"
+    # pydantic reserves the model_ prefix, so no field has the name of the fields set item
+    fields = namedtuple(f"_{name}Fields", [*model.model_fields, "model_fields_set"])  # type: ignore[misc]
+
+    return type(
+        name,
+        (fields, ModelView),
+        {"__slots__": (), "__module__": __name__, "__doc__": f"Read-only view of {model.__name__}.", "model": model},
+    )
+
+
+def to_view(model: M) -> ModelView[M]:
+    return view_class(type(model)).from_model(model)
+
+
+def to_views(models: Iterable[M]) -> list[ModelView[M]]:
+    return [to_view(model) for model in models]
+
+
+def from_view(view: ModelView[M], validate: bool = False) -> M:
+    return view.to_model(validate)
+
+
+def from_views(views: Iterable[ModelView[M]], validate: bool = False) -> list[M]:
+    return [view.to_model(validate) for view in views]
+
+
+# field types of the predefined views, kept in sync with the models by tests/unit/test_view.py
+class _TicketmasterPlaceAvailableFields(Protocol):
+    list_price: Decimal
+    total_price: Decimal
+    offer_id: str | None
+    offer_name: str
+    sellable_quantities: list[int] | None
+    protected: bool
+    inventory_type: str
+    count: int | None
+    full_section: str | None
+    section: str | None
+    row: str | None
+    row_rank: int | None
+    seat_rank: int | None
+    seat_number: str | None
+    attributes: list[str]
+    description: list[str]
+    inserted: datetime.datetime | None
+    prev_updated: datetime.datetime | None
+    update_reason: str | None
+
+
+class _SeatDataFields(Protocol):
+    section: str
+    row: str
+    seat: str
+    price: Decimal
+
+
+class _ActionDataFields(Protocol):
+    source_id: str
+    local_datetime: datetime.datetime
+    listing_id: int
+    inventory_id: int
+    section: str
+    row: str
+    seats: list[str]
+    internal_notes: str
+    ticket_description: Optional[str]
+    public_notes: str
+    quantity: int
+    tags: list[str]
+    listing_price: Decimal
+    original_price: Decimal
+    split_type: SplitType
+    price_markup: PriceMarkup
+
+
+class _MessageHeaderFields(Protocol):
+    event_message_id: str
+    event_source: EventSource
+    venue_id: str | None
+    event_id: str
+    event_action: EventAction
+    event_timestamp: datetime.datetime | None
+    no_map: bool | None
+    not_found: bool | None
+    not_on_sale: bool | None
+
+
+if TYPE_CHECKING:
+
+    class TicketmasterPlaceAvailableView(_TicketmasterPlaceAvailableFields, ModelView[TicketmasterPlaceAvailable]): ...
+
+    class SeatDataView(_SeatDataFields, ModelView[SeatData]): ...
+
+    class ActionDataView(_ActionDataFields, ModelView[ActionData]): ...
+
+    class MessageHeaderView(_MessageHeaderFields, ModelView[MessageHeader]): ...
+
+else:
+    TicketmasterPlaceAvailableView = view_class(TicketmasterPlaceAvailable)
+    SeatDataView = view_class(SeatData)
+    ActionDataView = view_class(ActionData)
+    MessageHeaderView = view_class(MessageHeader)
@@ -0,0 +1,74 @@
+import datetime
+import json
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from event_models.action.action import ActionLogSchema, SyncedActionLogSchema, UnsyncedActionLogSchema
+from event_models.action.batch import dump_action_logs_json, validate_action_logs, validate_action_logs_json
+
+SYNC_TIME = "2024-06-01T12:00:00"
+SYNCED_VALUES = [True, False, 1, 0, 2, 1.0, 0.0, "true", "false", "yes", "off", "maybe", Decimal(1), None, [True]]
+SYNC_TIMES = [SYNC_TIME, datetime.datetime(2024, 6, 1, 12), None, "", "yesterday", 0, 0.0, Decimal(0), 5, False]
+
+
+def _row(**values: Any) -> dict[str, Any]:
+    return {"action_id": 1, "action_exchange_id": "exchange-1", "action_exchange": "Viagogo", **values}
+
+
+ROWS = [
+    *(_row(synced=synced, sync_time=sync_time) for synced in SYNCED_VALUES for sync_time in SYNC_TIMES),
+    *(_row(synced=synced) for synced in SYNCED_VALUES),
+    _row(sync_time=SYNC_TIME),
+    _row(),
+]
+
+
+def _schema(row: dict[str, Any], json_input: bool) -> ActionLogSchema | None:
+    try:
+        if json_input:
+            return ActionLogSchema.model_validate_json(json.dumps(row, default=str))
+
+        return ActionLogSchema.model_validate(row)
+    except ValidationError:
+        return None
+
+
+def _record(row: dict[str, Any], json_input: bool) -> ActionLogSchema | None:
+    try:
+        if json_input:
+            (record,) = validate_action_logs_json(json.dumps([row], default=str))
+        else:
+            (record,) = validate_action_logs([row])
+    except ValidationError:
+        return None
+
+    return record.to_action_log_schema()
+
+
+@pytest.mark.parametrize("json_input", [False, True])
+@pytest.mark.parametrize("row", ROWS, ids=repr)
+def test_validate_action_logs_matches_action_log_schema(row: dict[str, Any], json_input: bool) -> None:
+    assert _record(row, json_input) == _schema(row, json_input)
+
+
+def test_validate_action_logs_record_types() -> None:
+    synced, unsynced, coerced = validate_action_logs(
+        [_row(synced=True, sync_time=SYNC_TIME), _row(synced=False), _row(synced=1)]
+    )
+
+    assert isinstance(synced, SyncedActionLogSchema)
+    assert isinstance(unsynced, UnsyncedActionLogSchema)
+    # the same as ActionLogSchema, only the exact True value requires the sync time
+    assert isinstance(coerced, UnsyncedActionLogSchema)
+    assert coerced.synced is True
+
+
+def test_dump_action_logs_json_round_trip() -> None:
+    records = validate_action_logs([_row(synced=True, sync_time=SYNC_TIME), _row(synced=False, error_code="API_ERROR")])
+    schemas = [record.to_action_log_schema() for record in records]
+
+    assert dump_action_logs_json(records) == dump_action_logs_json(schemas)
+    assert validate_action_logs_json(dump_action_logs_json(records)) == records
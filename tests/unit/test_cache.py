@@ -0,0 +1,181 @@
+import datetime
+import json
+from typing import Any
+
+from event_models.available.cache import DEFAULT_EVENT_SIZE, AvailabilitySnapshotCache, SnapshotCacheStats
+from event_models.available.ticketmaster import TicketmasterEventAvailable
+
+PLACE_SIZE = 100
+
+
+def _place(price: str = "120.50") -> list[Any]:
+    return [
+        price,
+        "135.25",
+        "offer",
+        "Standard Admission",
+        [1, 2],
+        False,
+        "primary",
+        None,
+        "SECTION 101",
+        "101",
+        "A",
+        1,
+        1,
+        "1",
+        ["aisle"],
+        [],
+        "2024-07-01T12:00:00",
+        None,
+        None,
+    ]
+
+
+def _places(count: int = 2, price: str = "120.50") -> dict[str, Any]:
+    return {f"place-{index}": _place(price) for index in range(count)}
+
+
+def _snapshot(event_id: str, places: int = 2) -> TicketmasterEventAvailable:
+    return TicketmasterEventAvailable.from_place_dict(event_id, _places(places))
+
+
+def _size(places: int = 2) -> int:
+    return DEFAULT_EVENT_SIZE + PLACE_SIZE * places
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_put_evicts_the_least_recently_used_snapshots_over_the_byte_budget() -> None:
+    cache = AvailabilitySnapshotCache(max_bytes=2 * _size(), place_size=PLACE_SIZE)
+    cache.put(_snapshot("event-1"))
+    cache.put(_snapshot("event-2"))
+
+    assert cache.get("event-1") is not None
+    cache.put(_snapshot("event-3"))
+
+    assert "event-1" in cache
+    assert "event-2" not in cache
+    assert "event-3" in cache
+    assert cache.stats.evictions == 1
+    assert cache.stats.size_bytes == 2 * _size()
+
+
+def test_put_evicts_until_a_larger_snapshot_fits() -> None:
+    cache = AvailabilitySnapshotCache(max_bytes=3 * _size(), place_size=PLACE_SIZE)
+
+    for index in range(3):
+        cache.put(_snapshot(f"event-{index}"))
+
+    cache.put(_snapshot("large", places=8))
+
+    assert [event_id for event_id in ("event-0", "event-1", "event-2", "large") if event_id in cache] == [
+        "event-2",
+        "large",
+    ]
+    assert cache.stats.evictions == 2
+
+
+def test_put_does_not_store_a_snapshot_over_the_byte_budget() -> None:
+    cache = AvailabilitySnapshotCache(max_bytes=_size() + _size(1), place_size=PLACE_SIZE)
+    cache.put(_snapshot("event-1"))
+    cache.put(_snapshot("event-2", places=1))
+
+    cache.put(_snapshot("event-1", places=20))
+
+    # the stale snapshot of the same event is removed, the other entries are kept
+    assert "event-1" not in cache
+    assert "event-2" in cache
+    assert cache.stats.size_bytes == _size(1)
+    assert cache.stats.evictions == 0
+
+
+def test_snapshots_expire_after_the_ttl() -> None:
+    clock = Clock()
+    cache = AvailabilitySnapshotCache(ttl=datetime.timedelta(seconds=10), place_size=PLACE_SIZE, clock=clock)
+    cache.put(_snapshot("event-1"))
+
+    clock.now = 10
+    assert cache.get("event-1") is not None
+
+    clock.now = 10.5
+    assert cache.get("event-1") is None
+    assert "event-1" not in cache
+    assert cache.stats.expirations == 1
+    assert cache.stats.size_bytes == 0
+
+
+def test_from_place_dict_skips_unchanged_content() -> None:
+    cache = AvailabilitySnapshotCache(place_size=PLACE_SIZE)
+    snapshot = cache.from_place_dict("event-1", _places())
+
+    assert cache.from_place_dict("event-1", _places()) is snapshot
+
+    changed = cache.from_place_dict("event-1", _places(price="99.00"))
+
+    assert changed is not snapshot
+    assert changed.places["place-0"].list_price == 99
+    assert cache.get("event-1") is changed
+    assert cache.stats.unchanged == 1
+
+
+def test_from_place_dict_uses_the_given_fingerprint() -> None:
+    cache = AvailabilitySnapshotCache(place_size=PLACE_SIZE)
+    snapshot = cache.from_place_dict("event-1", _places(), fingerprint=b"v1")
+
+    # the caller's fingerprint decides, not the content
+    assert cache.from_place_dict("event-1", _places(price="99.00"), fingerprint=b"v1") is snapshot
+    assert cache.from_place_dict("event-1", _places(), fingerprint=b"v2") is not snapshot
+
+
+def test_from_raw_hash_skips_unchanged_content() -> None:
+    cache = AvailabilitySnapshotCache(place_size=PLACE_SIZE)
+    raw = {place_id.encode(): json.dumps(value).encode() for place_id, value in _places().items()}
+    snapshot = cache.from_raw_hash("event-1", raw)
+
+    assert list(snapshot.places) == ["place-0", "place-1"]
+    assert cache.from_raw_hash("event-1", dict(raw)) is snapshot
+
+    raw[b"place-0"] = json.dumps(_place("99.00")).encode()
+
+    assert cache.from_raw_hash("event-1", raw) is not snapshot
+    assert cache.stats.unchanged == 1
+
+
+def test_stats_count_cache_operations() -> None:
+    clock = Clock()
+    cache = AvailabilitySnapshotCache(
+        max_bytes=2 * _size(),
+        ttl=datetime.timedelta(seconds=10),
+        place_size=PLACE_SIZE,
+        clock=clock,
+    )
+
+    cache.from_place_dict("event-1", _places())
+    cache.from_place_dict("event-1", _places())
+    cache.get("event-1")
+    cache.get("missing")
+    cache.put(_snapshot("event-2"))
+    cache.put(_snapshot("event-3"))
+    clock.now = 11
+    cache.get("event-3")
+
+    assert cache.stats == SnapshotCacheStats(
+        hits=2,
+        misses=3,
+        unchanged=1,
+        evictions=1,
+        expirations=1,
+        entries=1,
+        size_bytes=_size(),
+    )
+
+    cache.invalidate("event-2")
+    assert cache.stats.entries == 0
+    assert cache.stats.size_bytes == 0
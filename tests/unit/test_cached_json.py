@@ -0,0 +1,113 @@
+import datetime
+import pickle
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+
+from event_models.event.event import ArchiveMessage, FrozenArchiveMessage
+from event_models.notification.notification import (
+    ChangeData,
+    DropsData,
+    DropsMessage,
+    FrozenDropsMessage,
+    FrozenPriceChangeMessage,
+    FrozenSeatData,
+    PriceChangeMessage,
+    SeatData,
+    SeatDataWithPriceChange,
+)
+
+TIMESTAMP = datetime.datetime(2024, 6, 1, 12)
+
+
+def _drops() -> DropsMessage:
+    seats = [SeatData(section="101", row="A", seat=str(seat), price=Decimal("120.50")) for seat in range(3)]
+
+    return DropsMessage(event_id="event", timestamp=TIMESTAMP, data=DropsData(seats=seats))
+
+
+def _frozen() -> FrozenDropsMessage:
+    return FrozenDropsMessage.from_message(_drops())
+
+
+def test_json_bytes_match_model_dump_json_and_are_cached() -> None:
+    frozen = _frozen()
+    data = frozen.json_bytes()
+
+    assert data == _drops().model_dump_json().encode()
+    assert frozen.json_bytes() is data
+
+
+def test_from_message_keeps_the_fields_set() -> None:
+    message = _drops()
+    frozen = FrozenDropsMessage.from_message(message)
+
+    assert frozen.model_fields_set == message.model_fields_set
+    assert frozen.model_dump_json(exclude_unset=True) == message.model_dump_json(exclude_unset=True)
+
+
+def test_from_message_price_changes() -> None:
+    seat = SeatDataWithPriceChange(
+        section="101", row="A", seat="1", price=Decimal(100), old_price=Decimal(120), price_change=Decimal(-20)
+    )
+    message = PriceChangeMessage(event_id="event", timestamp=TIMESTAMP, data=ChangeData(seats=[seat]))
+    frozen = FrozenPriceChangeMessage.from_message(message)
+
+    assert frozen.json_bytes() == message.model_dump_json().encode()
+
+    with pytest.raises(ValidationError):
+        frozen.data.seats[0].price_change = Decimal(0)
+
+
+def test_model_copy_does_not_carry_the_cache() -> None:
+    frozen = _frozen()
+    frozen.json_bytes()
+
+    copied = frozen.model_copy(update={"event_id": "other"})
+
+    assert copied.json_bytes() == copied.model_dump_json().encode()
+    assert b'"event_id":"other"' in copied.json_bytes()
+
+
+def test_pickling_does_not_carry_the_cache() -> None:
+    frozen = FrozenArchiveMessage.from_message(
+        ArchiveMessage(message_id="message", venue_id="venue", event_timestamp=TIMESTAMP)
+    )
+    frozen.json_bytes()
+
+    restored = pickle.loads(pickle.dumps(frozen))  # noqa: S301
+
+    assert not hasattr(restored, "_json_cache")
+    assert restored.json_bytes() == frozen.json_bytes()
+    assert restored == frozen
+
+
+def test_json_view_is_read_only() -> None:
+    view = _frozen().json_view()
+
+    assert view.readonly
+
+    with pytest.raises(TypeError):
+        view[0] = 0
+
+
+def test_frozen_message_rejects_assignment() -> None:
+    frozen = _frozen()
+
+    with pytest.raises(ValidationError):
+        frozen.event_id = "other"
+
+
+def test_frozen_message_nested_data_is_immutable() -> None:
+    frozen = _frozen()
+    seats = frozen.data.seats
+
+    assert isinstance(seats, tuple)
+    assert all(isinstance(seat, FrozenSeatData) for seat in seats)
+
+    with pytest.raises(ValidationError):
+        seats[0].price = Decimal(1)
+
+    with pytest.raises(ValidationError):
+        frozen.data.seats = ()
@@ -0,0 +1,184 @@
+import json
+from collections.abc import Iterator
+
+import pytest
+
+from event_models.action.batch import validate_actions_json
+from event_models.available.ticketmaster import TicketmasterEventAvailable
+from event_models.intern.intern import (
+    EventInternPools,
+    InternPool,
+    active_pool,
+    disable_interning,
+    enable_interning,
+    intern_model,
+    interning,
+)
+
+PLACE = [
+    "120.50",
+    "135.25",
+    "offer",
+    "Standard Admission",
+    [1, 2],
+    False,
+    "primary",
+    None,
+    "SECTION 101",
+    "101",
+    "A",
+    1,
+    1,
+    "1",
+    ["aisle"],
+    ["Limited view"],
+    "2024-07-01T12:00:00",
+    None,
+    None,
+]
+ACTION = {
+    "action_id": 1,
+    "created": "2024-07-01T12:00:00",
+    "origin_id": 1,
+    "action": "UPDATED",
+    "data": {
+        "source_id": "source",
+        "local_datetime": "2024-07-01T20:00:00",
+        "listing_id": 1,
+        "inventory_id": 1,
+        "section": "101",
+        "row": "A",
+        "seats": ["1"],
+        "internal_notes": "",
+        "public_notes": "",
+        "quantity": 1,
+        "tags": ["aisle"],
+        "listing_price": "120.50",
+        "original_price": "100.00",
+        "split_type": "ANY",
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def no_default_pool() -> Iterator[None]:
+    disable_interning()
+    yield
+    disable_interning()
+
+
+def _decode_places() -> TicketmasterEventAvailable:
+    # JSON decoding creates a new string for every occurrence
+    return TicketmasterEventAvailable.from_place_dict("event", json.loads(json.dumps({"1": PLACE, "2": PLACE})))
+
+
+def _fresh(value: str) -> str:
+    return "".join(list(value))
+
+
+def test_intern_pool_evicts_the_least_recently_used_strings() -> None:
+    pool = InternPool(max_size=2)
+    section = _fresh("section")
+    row = _fresh("row")
+
+    assert pool.intern(section) is section
+    assert pool.intern(row) is row
+    assert pool.intern(_fresh("section")) is section
+    pool.intern(_fresh("seat"))
+
+    assert len(pool) == 2
+    assert pool.intern(_fresh("section")) is section
+    # the row was the least recently used string when the seat was added
+    assert pool.intern(_fresh("row")) is not row
+    assert (pool.hits, pool.misses, pool.evictions) == (2, 4, 2)
+
+    pool.clear()
+    assert len(pool) == 0
+
+
+def test_intern_pool_size_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="must be positive"):
+        InternPool(max_size=0)
+
+
+def test_event_intern_pools_drop_the_least_recently_used_event() -> None:
+    pools = EventInternPools(max_events=2, max_size=10)
+    first = pools.pool("event-1")
+    second = pools.pool("event-2")
+
+    assert pools.pool("event-1") is first
+    pools.pool("event-3")
+
+    assert len(pools) == 2
+    assert pools.pool("event-1") is first
+    assert pools.pool("event-2") is not second
+    assert first.max_size == 10
+
+    pools.discard("event-1")
+    assert pools.pool("event-1") is not first
+
+
+def test_interning_contexts_nest_and_reset() -> None:
+    outer = InternPool()
+    inner = InternPool()
+
+    with interning(outer):
+        with interning(inner):
+            assert active_pool() is inner
+
+        assert active_pool() is outer
+
+    assert active_pool() is None
+
+
+def test_interning_context_overrides_the_default_pool() -> None:
+    default = enable_interning()
+    pool = InternPool()
+
+    with interning(pool):
+        assert active_pool() is pool
+
+    assert active_pool() is default
+
+    disable_interning()
+    assert active_pool() is None
+
+
+def test_enable_interning_uses_the_given_pool() -> None:
+    pool = InternPool()
+
+    assert enable_interning(pool) is pool
+    assert active_pool() is pool
+
+
+def test_decoded_places_share_interned_strings() -> None:
+    with interning(InternPool()) as pool:
+        first, second = _decode_places().places.values()
+
+    assert first.section is second.section
+    assert first.offer_name is second.offer_name
+    assert first.attributes[0] is second.attributes[0]
+    assert pool.hits > 0
+
+
+def test_decoded_places_are_not_interned_without_a_pool() -> None:
+    first, second = _decode_places().places.values()
+
+    assert first.section == second.section
+    assert first.section is not second.section
+
+
+def test_intern_model_keeps_the_fields_set() -> None:
+    (action,) = validate_actions_json(json.dumps([ACTION]))
+    assert action.data is not None
+    fields_set = set(action.data.model_fields_set)
+
+    with interning(InternPool()) as pool:
+        (other,) = validate_actions_json(json.dumps([ACTION]))
+        intern_model(action.data)
+
+    assert other.data is not None
+    assert action.data.section is other.data.section
+    assert action.data.tags[0] is other.data.tags[0]
+    assert action.data.model_fields_set == fields_set
+    assert len(pool) == 4
@@ -0,0 +1,115 @@
+import datetime
+import random
+from collections import defaultdict
+from decimal import Decimal
+
+import pytest
+
+from event_models.action.action import ActionData, SplitType
+from event_models.action.pricing import (
+    HAS_NUMPY,
+    MarkupType,
+    PriceBase,
+    PriceKey,
+    PriceRounding,
+    PricingRule,
+    compute_price,
+    compute_prices,
+)
+from event_models.exchange.exchange import EventExchange
+
+EXCHANGES = [EventExchange.VIAGOGO, EventExchange.STUBHUB, EventExchange.TICKPICK]
+VECTORIZE = [False, pytest.param(True, marks=pytest.mark.skipif(not HAS_NUMPY, reason="NumPy is not installed"))]
+
+
+def _price(rng: random.Random, scale: int) -> Decimal:
+    return Decimal(rng.randint(-50_000, 50_000)).scaleb(-scale)
+
+
+def _listings(seed: int, count: int = 200) -> list[ActionData]:
+    rng = random.Random(seed)  # noqa: S311
+    listings = []
+
+    for listing_id in range(count):
+        exchanges = rng.sample(EXCHANGES, rng.randint(0, 3))
+        markups = {exchange: _price(rng, rng.choice((0, 2, 4))) for exchange in exchanges}
+        listings.append(
+            ActionData(
+                source_id="source",
+                local_datetime=datetime.datetime(2024, 7, 1, 20),
+                listing_id=listing_id,
+                inventory_id=listing_id,
+                section="101",
+                row="A",
+                seats=["1"],
+                internal_notes="",
+                public_notes="",
+                quantity=1,
+                tags=[],
+                listing_price=_price(rng, rng.choice((0, 1, 2, 3))),
+                original_price=_price(rng, 2),
+                split_type=SplitType.ANY,
+                price_markup=defaultdict(Decimal, markups),
+            )
+        )
+
+    return listings
+
+
+def _expected(
+    listings: list[ActionData], exchanges: list[EventExchange] | None, rule: PricingRule
+) -> dict[PriceKey, int]:
+    return {
+        (data.listing_id, exchange): int(compute_price(data, exchange, rule).scaleb(rule.scale))
+        for data in listings
+        for exchange in (exchanges if exchanges is not None else data.price_markup)
+    }
+
+
+@pytest.mark.parametrize("use_numpy", VECTORIZE)
+@pytest.mark.parametrize("markup_type", list(MarkupType))
+@pytest.mark.parametrize("rounding", list(PriceRounding))
+@pytest.mark.parametrize("scale", [0, 2, 3])
+def test_compute_prices_matches_compute_price(
+    use_numpy: bool, markup_type: MarkupType, rounding: PriceRounding, scale: int
+) -> None:
+    listings = _listings(seed=scale)
+    rule = PricingRule(markup_type=markup_type, rounding=rounding, scale=scale)
+
+    assert compute_prices(listings, rule=rule, use_numpy=use_numpy) == _expected(listings, None, rule)
+
+
+@pytest.mark.parametrize("use_numpy", VECTORIZE)
+@pytest.mark.parametrize("base", list(PriceBase))
+def test_compute_prices_fixed_exchanges_count_missing_markups_as_zero(use_numpy: bool, base: PriceBase) -> None:
+    listings = _listings(seed=1)
+    exchanges = [*EXCHANGES, EventExchange.SEATGEEK]
+    rule = PricingRule(markup_type=MarkupType.PERCENTAGE, base=base)
+
+    assert compute_prices(listings, exchanges, rule, use_numpy) == _expected(listings, exchanges, rule)
+    # missing exchanges are not inserted into the defaultdicts
+    assert all(EventExchange.SEATGEEK not in data.price_markup for data in listings)
+
+
+@pytest.mark.parametrize("use_numpy", VECTORIZE)
+@pytest.mark.parametrize("rounding", list(PriceRounding))
+def test_compute_prices_ties(use_numpy: bool, rounding: PriceRounding) -> None:
+    # x.xx5 values are exact ties at the default scale
+    listings = _listings(seed=2, count=20)
+
+    for data in listings:
+        data.listing_price = Decimal(data.listing_price).quantize(Decimal("0.01")) + Decimal("0.005")
+
+    rule = PricingRule(rounding=rounding)
+
+    assert compute_prices(listings, rule=rule, use_numpy=use_numpy) == _expected(listings, None, rule)
+
+
+@pytest.mark.parametrize("use_numpy", VECTORIZE)
+def test_compute_prices_converts_exactly_beyond_float_precision(use_numpy: bool) -> None:
+    listings = _listings(seed=3, count=5)
+    listings[0].listing_price = Decimal("1.0000000001")
+    listings[1].listing_price = Decimal("123456789012345678.91")
+    rule = PricingRule(markup_type=MarkupType.PERCENTAGE, scale=9)
+
+    assert compute_prices(listings, rule=rule, use_numpy=use_numpy) == _expected(listings, None, rule)
@@ -0,0 +1,150 @@
+import logging
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from event_models.available.ticketmaster import TicketmasterEventAvailable, TicketmasterPlaceAvailable
+from event_models.logger.logger import AppLogger
+from event_models.logger.message import LoggerMessage
+from event_models.profiling.profiling import (
+    disable_profiling,
+    enable_profiling,
+    log_profiling,
+    profiling_session,
+    profiling_snapshot,
+    reset_profiling,
+)
+
+PLACE_DICT = {
+    f"place-{index}": [
+        "120.5",
+        135.25,
+        "offer",
+        "Standard Admission",
+        [1, 2],
+        False,
+        "primary",
+        None,
+        "SECTION 101",
+        "101",
+        "A",
+        1,
+        index,
+        str(index),
+        ["aisle"],
+        ["Limited view"],
+        "2024-07-01T12:00:00",
+        None,
+        "price",
+    ]
+    for index in range(25)
+}
+
+
+@pytest.fixture
+def profiled() -> Iterator[None]:
+    reset_profiling()
+
+    with profiling_session():
+        yield
+
+    reset_profiling()
+
+
+def _event_data() -> dict[str, Any]:
+    places = {
+        place_id: dict(zip(TicketmasterPlaceAvailable.model_fields, place)) for place_id, place in PLACE_DICT.items()
+    }
+
+    return {"event_id": "event", "places": places, "old_schema": False}
+
+
+def _field_count(validator: str) -> int:
+    return len(TicketmasterPlaceAvailable.__pydantic_decorators__.field_validators[validator].info.fields)
+
+
+@pytest.mark.usefixtures("profiled")
+def test_validator_calls_match_constructions() -> None:
+    TicketmasterEventAvailable.from_place_dict("event", PLACE_DICT)
+    snapshot = profiling_snapshot()
+
+    assert snapshot.models["TicketmasterEventAvailable"].constructions == 1
+    places = snapshot.models["TicketmasterPlaceAvailable"].constructions
+    assert places == len(PLACE_DICT)
+
+    # the validated places are not validated again when they are passed into the event
+    profile = snapshot.validators["TicketmasterPlaceAvailable.set_decimal_places"]
+    assert profile.calls == places * _field_count("set_decimal_places")
+    assert profile.errors == 0
+
+
+def test_disable_profiling_restores_the_model_entry_points() -> None:
+    entry_points = dict(BaseModel.__dict__)
+    validator = TicketmasterPlaceAvailable.__pydantic_decorators__.field_validators["set_decimal_places"].func
+
+    enable_profiling()
+
+    try:
+        assert BaseModel.__dict__["model_validate"] is not entry_points["model_validate"]
+    finally:
+        disable_profiling()
+
+    assert dict(BaseModel.__dict__) == entry_points
+    assert TicketmasterPlaceAvailable.__pydantic_decorators__.field_validators["set_decimal_places"].func == validator
+
+
+def test_validators_of_models_built_before_enabling_are_recorded() -> None:
+    reset_profiling()
+    # the nested place schema is compiled into the event schema
+    TicketmasterEventAvailable.model_validate(_event_data())
+
+    with profiling_session():
+        TicketmasterEventAvailable.model_validate(_event_data())
+
+    snapshot = profiling_snapshot()
+    reset_profiling()
+    TicketmasterEventAvailable.model_validate(_event_data())
+
+    assert snapshot.models["TicketmasterEventAvailable"].constructions == 1
+    # nested models are validated by the parent, they are not constructions of their own
+    assert "TicketmasterPlaceAvailable" not in snapshot.models
+    profile = snapshot.validators["TicketmasterPlaceAvailable.set_decimal_places"]
+    assert profile.calls == len(PLACE_DICT) * _field_count("set_decimal_places")
+    # the validators are not recorded after disabling
+    assert profiling_snapshot().validators == {}
+
+
+@pytest.mark.usefixtures("profiled")
+def test_serializations_are_recorded() -> None:
+    event = TicketmasterEventAvailable.from_place_dict("event", PLACE_DICT)
+    event.model_dump()
+    event.model_dump_json()
+    event.places["place-0"].model_dump_json()
+    snapshot = profiling_snapshot()
+
+    profile = snapshot.models["TicketmasterEventAvailable"]
+    assert profile.serializations == 2
+    assert profile.serialization_seconds > 0
+    # nested models are serialized by the parent
+    assert snapshot.models["TicketmasterPlaceAvailable"].serializations == 1
+
+
+@pytest.mark.usefixtures("profiled")
+def test_log_profiling_logs_every_model_and_validator(caplog: pytest.LogCaptureFixture) -> None:
+    TicketmasterEventAvailable.from_place_dict("event", PLACE_DICT)
+    caplog.set_level(logging.INFO, logger="test_profiling")
+
+    log_profiling(AppLogger("test_profiling"), reset=True)
+
+    assert {record.getMessage().split(":")[0] for record in caplog.records} == {
+        "Model TicketmasterEventAvailable",
+        "Model TicketmasterPlaceAvailable",
+        "Validator TicketmasterPlaceAvailable.set_decimal_places",
+    }
+    assert {record.message_id for record in caplog.records} == {str(LoggerMessage.PROFILING)}
+    validator = next(record for record in caplog.records if record.getMessage().startswith("Validator"))
+    assert validator.profiling["calls"] == len(PLACE_DICT) * _field_count("set_decimal_places")
+    # the recorded data is reset after logging
+    assert profiling_snapshot().models == {}
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from event_models.event.event import EventAction, EventMessage, EventSource, MessageHeader
+from event_models.event.router import EventRouter, RouteConfig
+
+
+def _message(event_id: str, sequence: int, event_action: EventAction = EventAction.STORE) -> EventMessage:
+    return EventMessage(
+        header=MessageHeader(
+            event_message_id=f"{event_id}-{sequence}",
+            event_source=EventSource.STUBHUB,
+            event_id=event_id,
+            event_action=event_action,
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_messages_of_an_event_are_handled_in_order_one_at_a_time() -> None:
+    handled: dict[str, list[str]] = {}
+    in_process: set[str] = set()
+    overlapping: list[str] = []
+
+    async def handler(message: EventMessage) -> None:
+        event_id = message.header.event_id
+
+        if event_id in in_process:
+            overlapping.append(message.header.event_message_id)
+
+        in_process.add(event_id)
+        # uneven handling times, so that the workers finish out of dispatch order
+        for _ in range(len(message.header.event_message_id) % 3):
+            await asyncio.sleep(0)
+
+        handled.setdefault(event_id, []).append(message.header.event_message_id)
+        in_process.discard(event_id)
+
+    router = EventRouter(RouteConfig(workers=4, max_queue_size=8))
+    router.register(handler)
+    messages = [_message(f"event-{index % 5}", index) for index in range(100)]
+
+    async with router:
+        for message in messages:
+            await router.dispatch(message)
+
+    assert overlapping == []
+    assert handled == {
+        f"event-{event}": [f"event-{event}-{index}" for index in range(event, 100, 5)] for event in range(5)
+    }
+    (stats,) = router.stats()
+    assert (stats.processed, stats.failed, stats.queue_depth, stats.in_flight) == (100, 0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_waits_while_the_route_is_full() -> None:
+    release = asyncio.Event()
+    handled: list[str] = []
+
+    async def handler(message: EventMessage) -> None:
+        await release.wait()
+        handled.append(message.header.event_message_id)
+
+    router = EventRouter(RouteConfig(workers=1, max_queue_size=2))
+    router.register(handler)
+
+    async with router:
+        await router.dispatch(_message("event-1", 1))
+        await router.dispatch(_message("event-2", 2))
+
+        assert not router.try_dispatch(_message("event-3", 3))
+        blocked = asyncio.create_task(router.dispatch(_message("event-3", 3)))
+
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert not blocked.done()
+        assert router.stats()[0].queue_depth + router.stats()[0].in_flight == 2
+
+        release.set()
+        await blocked
+
+    assert handled == ["event-1-1", "event-2-2", "event-3-3"]
+
+
+@pytest.mark.asyncio
+async def test_routes_have_separate_queues() -> None:
+    release = asyncio.Event()
+    archived: list[str] = []
+
+    async def store(message: EventMessage) -> None:
+        await release.wait()
+
+    async def archive(message: EventMessage) -> None:
+        archived.append(message.header.event_message_id)
+
+    router = EventRouter(RouteConfig(workers=1, max_queue_size=1))
+    router.register(store, event_action=EventAction.STORE)
+    router.register(archive, event_action=EventAction.ARCHIVE)
+
+    async with router:
+        await router.dispatch(_message("event-1", 1))
+        assert not router.try_dispatch(_message("event-1", 2))
+
+        # a full store route does not hold back other routes
+        await router.dispatch(_message("event-1", 3, EventAction.ARCHIVE))
+        await router.routes[1].join()
+        assert archived == ["event-1-3"]
+
+        release.set()
@@ -0,0 +1,112 @@
+import datetime
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from event_models.available.snapshot import (
+    AvailabilitySnapshot,
+    checkpoint,
+    encode_snapshot,
+    restore,
+    snapshot_path,
+    write_snapshot,
+)
+from event_models.available.ticketmaster import TicketmasterEventAvailable, TicketmasterPlaceAvailable
+
+
+def _event(event_id: str, places: int = 3) -> TicketmasterEventAvailable:
+    return TicketmasterEventAvailable(
+        event_id=event_id,
+        places={
+            f"place-{index}": TicketmasterPlaceAvailable(
+                list_price=Decimal("120.50"),
+                total_price=Decimal("135.25"),
+                offer_id="offer",
+                offer_name="Standard Admission",
+                sellable_quantities=[1, 2],
+                protected=False,
+                inventory_type="primary",
+                full_section="SECTION 101",
+                section="101",
+                row="A",
+                row_rank=1,
+                seat_rank=index,
+                seat_number=str(index),
+                attributes=["aisle"],
+                description=[],
+                inserted=datetime.datetime(2024, 7, 1, 12),
+                prev_updated=None,
+                update_reason=None,
+            )
+            for index in range(places)
+        },
+        old_schema=False,
+    )
+
+
+def test_checkpoint_restore_round_trip(tmp_path: Path) -> None:
+    events = [_event("event-1"), _event("event/2")]
+    checkpoint(events, tmp_path)
+
+    snapshots = restore(tmp_path)
+
+    try:
+        assert {event_id: snapshot.to_model() for event_id, snapshot in snapshots.items()} == {
+            event.event_id: event for event in events
+        }
+    finally:
+        for snapshot in snapshots.values():
+            snapshot.close()
+
+
+def test_restored_snapshot_serializes_like_the_original(tmp_path: Path) -> None:
+    event = _event("event-1")
+    write_snapshot(event, snapshot_path(tmp_path, "event-1"))
+
+    with AvailabilitySnapshot.open(snapshot_path(tmp_path, "event-1")) as snapshot:
+        restored = snapshot.to_model()
+
+    assert restored.model_dump_json() == event.model_dump_json()
+    assert restored.places["place-1"].model_dump_json() == event.places["place-1"].model_dump_json()
+
+
+def test_restore_skips_unreadable_files(tmp_path: Path) -> None:
+    write_snapshot(_event("event-1"), snapshot_path(tmp_path, "event-1"))
+    snapshot_path(tmp_path, "empty").touch()
+    snapshot_path(tmp_path, "truncated").write_bytes(encode_snapshot(_event("truncated"))[:-10])
+    snapshot_path(tmp_path, "header").write_bytes(b"EVAV")
+    snapshot_path(tmp_path, "other").write_bytes(b"not a snapshot" * 10)
+
+    snapshots = restore(tmp_path)
+
+    assert list(snapshots) == ["event-1"]
+    snapshots["event-1"].close()
+
+
+def test_restore_closes_opened_snapshots_on_failure(tmp_path: Path) -> None:
+    checkpoint([_event("event-1"), _event("event-2")], tmp_path)
+    opened: list[AvailabilitySnapshot] = []
+    original_open = AvailabilitySnapshot.open
+
+    def failing_open(path: Path) -> AvailabilitySnapshot:
+        if opened:
+            raise MemoryError
+
+        opened.append(original_open(path))
+        return opened[-1]
+
+    with mock.patch.object(AvailabilitySnapshot, "open", failing_open), pytest.raises(MemoryError):
+        restore(tmp_path)
+
+    assert opened[0]._buffer.closed  # type: ignore[union-attr]
+
+
+def test_write_snapshot_removes_temporary_file_on_failure(tmp_path: Path) -> None:
+    path = snapshot_path(tmp_path, "event-1")
+
+    with mock.patch("os.fsync", side_effect=OSError("disk full")), pytest.raises(OSError, match="disk full"):
+        write_snapshot(_event("event-1"), path)
+
+    assert list(tmp_path.iterdir()) == []
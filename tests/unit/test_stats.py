@@ -0,0 +1,21 @@
+import pytest
+
+from event_models._stats import percentile
+
+
+@pytest.mark.parametrize(
+    ("values", "fraction", "expected"),
+    [
+        ([], 0.5, None),
+        ([7.0], 0.5, 7.0),
+        ([7.0], 0.99, 7.0),
+        ([1.0, 2.0], 0.5, 1.0),
+        ([1.0, 2.0, 3.0, 4.0], 0.5, 2.0),
+        ([1.0, 2.0, 3.0, 4.0, 5.0], 0.5, 3.0),
+        ([float(value) for value in range(1, 101)], 0.99, 99.0),
+        ([float(value) for value in range(1, 101)], 1.0, 100.0),
+        ([1.0, 2.0, 3.0], 0.0, 1.0),
+    ],
+)
+def test_percentile_is_the_nearest_rank(values: list[float], fraction: float, expected: float | None) -> None:
+    assert percentile(values, fraction) == expected
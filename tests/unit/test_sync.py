@@ -0,0 +1,172 @@
+import datetime
+
+from event_models.action.action import ActionError, ActionSchema, ActionStatus
+from event_models.action.sync import SyncQueue, SyncQueueConfig
+from event_models.exchange.exchange import EventExchange
+
+NOW = datetime.datetime(2024, 7, 1, 12)
+EXCHANGE = EventExchange.VIAGOGO
+
+
+def _action(action_id: int, status: ActionStatus) -> ActionSchema:
+    return ActionSchema(action_id=action_id, created=NOW, origin_id=1, action=status, action_exchange_id="listing")
+
+
+def _fail_next(queue: SyncQueue, now: datetime.datetime) -> bool:
+    (item,) = queue.next_batch(EXCHANGE, now)
+    return queue.fail(item, ActionError.API_ERROR, "API error", now=now).retryable
+
+
+def test_update_replacing_a_retry_starts_with_fresh_attempts() -> None:
+    queue = SyncQueue(SyncQueueConfig(max_attempts=3))
+    queue.submit(_action(1, ActionStatus.UPDATED), EXCHANGE)
+
+    assert _fail_next(queue, NOW)
+    later = NOW + datetime.timedelta(hours=1)
+    assert _fail_next(queue, later)
+
+    assert not queue.submit(_action(2, ActionStatus.SOLD), EXCHANGE)
+    (item,) = queue.next_batch(EXCHANGE, later)
+
+    assert item.action.action is ActionStatus.SOLD
+    assert item.attempts == 0
+    assert item.not_before is None
+    assert item.coalesced == 1
+    assert queue.fail(item, ActionError.API_ERROR, "API error", now=later).retryable
+
+
+def test_terminal_retry_keeps_its_schedule() -> None:
+    queue = SyncQueue(SyncQueueConfig(max_attempts=3))
+    queue.submit(_action(1, ActionStatus.SOLD), EXCHANGE)
+
+    assert _fail_next(queue, NOW)
+    assert not queue.submit(_action(2, ActionStatus.UPDATED), EXCHANGE)
+
+    assert queue.next_batch(EXCHANGE, NOW) == []
+    (item,) = queue.next_batch(EXCHANGE, NOW + datetime.timedelta(hours=1))
+
+    assert item.action.action is ActionStatus.SOLD
+    assert item.attempts == 1
+
+
+def test_update_queued_while_in_flight_supersedes_the_retry() -> None:
+    queue = SyncQueue(SyncQueueConfig(max_attempts=3))
+    queue.submit(_action(1, ActionStatus.UPDATED), EXCHANGE)
+    (item,) = queue.next_batch(EXCHANGE, NOW)
+
+    queue.submit(_action(2, ActionStatus.REMOVED), EXCHANGE)
+    assert queue.fail(item, ActionError.API_ERROR, "API error", now=NOW).retryable
+
+    (retry,) = queue.next_batch(EXCHANGE, NOW)
+    assert retry.action.action is ActionStatus.REMOVED
+    assert retry.attempts == 0
+
+
+def test_next_batch_uses_the_exchange_batch_size() -> None:
+    queue = SyncQueue(SyncQueueConfig(max_batch_size=3, exchange_batch_size={EventExchange.STUBHUB: 2}))
+
+    for index in range(5):
+        queue.submit(_action(index, ActionStatus.UPDATED), EXCHANGE, f"listing-{index}")
+        queue.submit(_action(index, ActionStatus.UPDATED), EventExchange.STUBHUB, f"listing-{index}")
+
+    assert [item.action_exchange_id for item in queue.next_batch(EXCHANGE, NOW)] == [
+        "listing-0",
+        "listing-1",
+        "listing-2",
+    ]
+    assert [item.action_exchange_id for item in queue.next_batch(EventExchange.STUBHUB, NOW)] == [
+        "listing-0",
+        "listing-1",
+    ]
+    assert len(queue) == 5
+    assert queue.in_flight == 5
+
+
+def test_next_batch_skips_keys_with_a_sync_in_flight() -> None:
+    queue = SyncQueue()
+    queue.submit(_action(1, ActionStatus.UPDATED), EXCHANGE)
+    (item,) = queue.next_batch(EXCHANGE, NOW)
+
+    assert queue.submit(_action(2, ActionStatus.UPDATED), EXCHANGE)
+    assert queue.ready_exchanges(NOW) == []
+    assert queue.next_batch(EXCHANGE, NOW) == []
+
+    queue.complete(item, NOW)
+    (queued,) = queue.next_batch(EXCHANGE, NOW)
+
+    assert queued.action.action_id == 2
+
+
+def test_complete_drops_non_terminal_updates_queued_after_a_terminal_state() -> None:
+    queue = SyncQueue()
+    queue.submit(_action(1, ActionStatus.SOLD), EXCHANGE)
+    (item,) = queue.next_batch(EXCHANGE, NOW)
+    queue.submit(_action(2, ActionStatus.UPDATED), EXCHANGE)
+
+    log = queue.complete(item, NOW)
+
+    assert log.synced
+    assert log.sync_time == NOW
+    assert len(queue) == 0
+
+
+def test_complete_keeps_terminal_updates_queued_after_a_terminal_state() -> None:
+    queue = SyncQueue()
+    queue.submit(_action(1, ActionStatus.SOLD), EXCHANGE)
+    (item,) = queue.next_batch(EXCHANGE, NOW)
+    queue.submit(_action(2, ActionStatus.REMOVED), EXCHANGE)
+
+    queue.complete(item, NOW)
+    (queued,) = queue.next_batch(EXCHANGE, NOW)
+
+    assert queued.action.action is ActionStatus.REMOVED
+
+
+def test_fail_is_not_retryable_for_non_retryable_errors() -> None:
+    queue = SyncQueue()
+    queue.submit(_action(1, ActionStatus.UPDATED), EXCHANGE)
+    (item,) = queue.next_batch(EXCHANGE, NOW)
+
+    log = queue.fail(item, ActionError.MISSING_MAPPING, "Missing mapping", now=NOW)
+
+    assert not log.retryable
+    assert log.error == {NOW: "Missing mapping"}
+    assert len(queue) == 0
+
+
+def test_fail_is_not_retryable_when_the_caller_says_so() -> None:
+    queue = SyncQueue()
+    queue.submit(_action(1, ActionStatus.UPDATED), EXCHANGE)
+    (item,) = queue.next_batch(EXCHANGE, NOW)
+
+    assert not queue.fail(item, ActionError.API_ERROR, "API error", retryable=False, now=NOW).retryable
+    assert len(queue) == 0
+
+
+def test_fail_is_not_retryable_after_max_attempts() -> None:
+    queue = SyncQueue(SyncQueueConfig(max_attempts=2, retry_delay=datetime.timedelta(0)))
+    queue.submit(_action(1, ActionStatus.UPDATED), EXCHANGE)
+
+    assert _fail_next(queue, NOW)
+    assert not _fail_next(queue, NOW)
+    assert len(queue) == 0
+
+
+def test_retry_delay_backs_off_exponentially_up_to_the_cap() -> None:
+    config = SyncQueueConfig(
+        max_attempts=10,
+        retry_delay=datetime.timedelta(seconds=5),
+        max_retry_delay=datetime.timedelta(seconds=30),
+    )
+    queue = SyncQueue(config)
+    queue.submit(_action(1, ActionStatus.UPDATED), EXCHANGE)
+    now = NOW
+
+    for delay in [5, 10, 20, 30, 30]:
+        assert _fail_next(queue, now)
+        retry_at = now + datetime.timedelta(seconds=delay)
+
+        assert queue.next_batch(EXCHANGE, retry_at - datetime.timedelta(microseconds=1)) == []
+        now = retry_at
+
+    assert _fail_next(queue, now)
@@ -0,0 +1,117 @@
+import asyncio
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from event_models.traffic.replay import QueueSink, decode_record, replay
+from event_models.traffic.traffic import (
+    TrafficConfig,
+    TrafficFormat,
+    TrafficGenerator,
+    TrafficRecord,
+    read_traffic,
+    write_traffic,
+)
+
+
+@pytest.fixture(scope="module")
+def records() -> list[TrafficRecord]:
+    return list(TrafficGenerator(TrafficConfig(seed=7)).records(300))
+
+
+def test_generator_is_reproducible(records: list[TrafficRecord]) -> None:
+    assert list(TrafficGenerator(TrafficConfig(seed=7)).records(300)) == records
+    assert {record.kind for record in records} == set(TrafficConfig().kinds)
+
+
+@pytest.mark.parametrize("file_name", ["traffic.ndjson", "traffic.bin"])
+def test_write_read_round_trip(tmp_path: Path, records: list[TrafficRecord], file_name: str) -> None:
+    path = tmp_path / file_name
+
+    assert write_traffic(records, path) == len(records)
+    assert list(read_traffic(path)) == records
+
+
+@pytest.mark.parametrize("traffic_format", list(TrafficFormat))
+def test_round_trip_records_decode(tmp_path: Path, records: list[TrafficRecord], traffic_format: TrafficFormat) -> None:
+    path = tmp_path / "traffic"
+    write_traffic(records[:50], path, traffic_format)
+
+    for record in read_traffic(path, traffic_format):
+        decode_record(record)
+
+
+# file header 6 bytes, record header 7 bytes
+@pytest.mark.parametrize("size", [3, 6 + 3, 6 + 7 + 2, -1], ids=["file header", "record header", "key", "data"])
+def test_read_truncated_binary_file_raises(tmp_path: Path, records: list[TrafficRecord], size: int) -> None:
+    path = tmp_path / "traffic.bin"
+    write_traffic(records[:1], path)
+    path.write_bytes(path.read_bytes()[:size])
+
+    with pytest.raises(ValueError, match="Truncated traffic file"):
+        list(read_traffic(path))
+
+
+def _drain(queue: asyncio.Queue[TrafficRecord]) -> list[TrafficRecord]:
+    received = []
+
+    while not queue.empty():
+        received.append(queue.get_nowait())
+
+    return received
+
+
+@pytest.mark.asyncio
+async def test_replay_sends_every_record_to_the_queue(records: list[TrafficRecord]) -> None:
+    sink = QueueSink()
+
+    report = await replay(records, sink)
+
+    assert _drain(sink.queue) == records
+    assert report.sent == len(records)
+    assert report.kinds == Counter(record.kind for record in records)
+    assert report.bytes == sum(len(record.data) for record in records)
+    assert report.target_rate is None
+    assert report.latency_p50 is not None
+
+
+@pytest.mark.asyncio
+async def test_replay_waits_for_a_bounded_queue(records: list[TrafficRecord]) -> None:
+    sink = QueueSink(maxsize=5)
+    received: list[TrafficRecord] = []
+
+    async def consume() -> None:
+        while len(received) < len(records):
+            received.append(await sink.queue.get())
+            # a slow consumer, the replay is ahead of it
+            await asyncio.sleep(0)
+
+    consumer = asyncio.create_task(consume())
+    report = await replay(records, sink)
+    await consumer
+
+    # more records than the queue holds, the replay only finishes by waiting for the consumer
+    assert received == records
+    assert report.sent == len(records)
+    assert sum(report.kinds.values()) == len(records)
+
+
+@pytest.mark.asyncio
+async def test_paced_replay_takes_the_scheduled_time(records: list[TrafficRecord]) -> None:
+    rate = 1000.0
+    sink = QueueSink()
+
+    report = await replay(records[:100], sink, rate)
+
+    assert report.sent == 100
+    assert report.target_rate == rate
+    # the last record is scheduled at (count - 1) / rate, the margin covers a busy test machine
+    assert 99 / rate <= report.elapsed < 100 / rate + 0.1
+    assert report.throughput == pytest.approx(rate, rel=0.5)
+
+
+@pytest.mark.asyncio
+async def test_replay_rejects_a_non_positive_rate(records: list[TrafficRecord]) -> None:
+    with pytest.raises(ValueError, match="must be positive"):
+        await replay(records, QueueSink(), rate=0)
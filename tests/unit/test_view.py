@@ -0,0 +1,52 @@
+from typing import get_type_hints
+
+import pytest
+from pydantic import BaseModel
+
+from event_models.action.action import ActionData
+from event_models.available.ticketmaster import TicketmasterPlaceAvailable
+from event_models.event.event import EventSource, MessageHeader
+from event_models.notification.notification import SeatData
+from event_models.view import view
+from event_models.view.view import SeatDataView, from_view, to_view, to_views
+
+TYPED_FIELDS = [
+    (TicketmasterPlaceAvailable, view._TicketmasterPlaceAvailableFields),
+    (SeatData, view._SeatDataFields),
+    (ActionData, view._ActionDataFields),
+    (MessageHeader, view._MessageHeaderFields),
+]
+
+
+@pytest.mark.parametrize(("model", "fields"), TYPED_FIELDS, ids=lambda value: value.__name__)
+def test_view_field_types_match_model(model: type[BaseModel], fields: type) -> None:
+    assert get_type_hints(fields) == {name: field.annotation for name, field in model.model_fields.items()}
+
+
+def test_view_round_trip() -> None:
+    seat = SeatData(section="101", row="A", seat="1", price=10)
+    seat_view = to_view(seat)
+
+    assert isinstance(seat_view, SeatDataView)
+    assert (seat_view.section, seat_view.row, seat_view.seat, seat_view.price) == ("101", "A", "1", seat.price)
+    assert seat_view.to_model() == seat
+
+    with pytest.raises(AttributeError):
+        seat_view.section = "102"
+
+
+@pytest.mark.parametrize("validate", [False, True])
+def test_view_round_trip_keeps_the_fields_set(validate: bool) -> None:
+    header = MessageHeader(
+        event_message_id="message-1", event_source=EventSource.VIVIDSEATS, event_id="event-1", venue_id="venue-1"
+    )
+    header_view = to_view(header)
+
+    assert header_view.model_fields_set == header.model_fields_set
+    assert from_view(header_view, validate).model_dump(exclude_unset=True) == header.model_dump(exclude_unset=True)
+
+
+def test_views_share_equal_fields_sets() -> None:
+    first, second = to_views([SeatData(section="101", row="A", seat=str(seat), price=10) for seat in range(2)])
+
+    assert first.model_fields_set is second.model_fields_set